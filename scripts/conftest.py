@@ -0,0 +1,57 @@
+import io
+
+import pytest
+import requests
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code=200, text="", headers=None, raw=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.raw = raw if raw is not None else io.BytesIO(text.encode("utf-8"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+
+class FakeWeb:
+    """Serves canned pages by URL and records every request's headers."""
+
+    def __init__(self):
+        self.pages = {}
+        self.requests = []
+
+    def serve(self, url, text="", etag=None, raw=None):
+        """Serve text, or the raw byte stream, at url, with an ETag when given."""
+        self.pages[url] = (text, etag, raw)
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        headers = dict(headers or {})
+        self.requests.append((url, headers))
+        if url not in self.pages:
+            return FakeResponse(404)
+        text, etag, raw = self.pages[url]
+        if etag is not None and headers.get("If-None-Match") == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, text, {"ETag": etag} if etag else {}, raw)
+
+
+@pytest.fixture
+def fake_web(monkeypatch):
+    """Fixture answering requests.get and requests.Session.get from a FakeWeb."""
+    web = FakeWeb()
+    monkeypatch.setattr(requests, "get", web.get)
+    monkeypatch.setattr(
+        requests.Session, "get", lambda session, url, **kwargs: web.get(url, **kwargs)
+    )
+    return web
@@ -1,4 +1,4 @@
-import json
+import functools
 import os
 import re
 from dataclasses import dataclass, field
@@ -6,6 +6,33 @@ from typing import List
 
 from pypdf import PdfReader
 
+from jsonio import read_json, write_json
+
+# Directory containing this script; relative input/output dirs resolve against it
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Default location of the core rules section files, resolved once at import
+DEFAULT_SECTIONS_DIR = os.path.normpath(
+    os.path.join(SCRIPT_DIR, "../rules_source/crsections")
+)
+
+
+# Matches one "<section>. <content>" line anywhere in a text blob.
+# Section numbers are digits, letters, and combinations with periods
+# Examples: 100, 204, 204.1, 204.1.a, 204.1.a.1
+# IMPORTANT: Must start with 3 digits (like 100) OR have dots (like 204.1)
+# This prevents single-digit numbers (1, 2, 3) from being parsed as standalone sections
+# Surrounding horizontal whitespace is excluded so it matches a stripped line.
+SECTION_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*((?:\d{3,})|(?:\d+(?:\.\d+)+)|(?:\d+(?:\.[a-zA-Z])+)|(?:\d+\.\d+\.[a-zA-Z](?:\.\d+)*))\.[^\S\n]+(\S(?:.*\S)?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Line boundaries that str.splitlines() recognizes besides "\n". Text from the
+# PDF extractors can contain "\r", form feeds or Unicode line separators, so
+# they become "\n" before SECTION_LINE_PATTERN scans the text line by line.
+LINE_BREAK_PATTERN = re.compile(r"\r\n?|[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
 
 def get_pdf_text(pdf_path):
     """
@@ -114,13 +141,28 @@ def parse_numbered_lines(text):
     return numbered_lines
 
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     section: str
     text: str
     children: list = field(default_factory=list)
 
 
+def parse_section_key(section):
+    """
+    Converts a section number into a hashable key, e.g. "204.1.a.2" becomes
+    (204, 1, "a", 2). The parent of a dotted section is then key[:-1], and the
+    hundred a single number belongs to is plain integer arithmetic.
+
+    Args:
+        section (str): Section number as it appears in the rules
+
+    Returns:
+        tuple: Numeric parts as ints, letter parts as strings
+    """
+    return tuple(int(part) if part.isdigit() else part for part in section.split("."))
+
+
 def parse_lines_to_objects(text):
     """
     Parses text into a list of Line objects with hierarchical section numbering.
@@ -135,90 +177,74 @@ def parse_lines_to_objects(text):
         list: List of top-level Line objects with nested children
     """
     top_level_lines = []
-    section_map = {}  # Maps section number to Line object
-
-    # Pattern matches: digits, letters, and combinations with periods
-    # Examples: 100, 204, 204.1, 204.1.a, 204.1.a.1
-    # IMPORTANT: Must start with 3 digits (like 100) OR have dots (like 204.1)
-    # This prevents single-digit numbers (1, 2, 3) from being parsed as standalone sections
-    pattern = re.compile(
-        r"^((?:\d{3,})|(?:\d+(?:\.\d+)+)|(?:\d+(?:\.[a-zA-Z])+)|(?:\d+\.\d+\.[a-zA-Z](?:\.\d+)*))\.\s+(.*)$"
-    )
-
-    all_sections = []  # List of (section, content) tuples in order
+    section_map = {}  # Maps section key to Line object, in document order
 
     # First pass: Create all Line objects
     # Skip duplicates - only keep first occurrence of each section
-    for line in text.splitlines():
-        stripped = line.strip()
-        match = pattern.match(stripped)
-        if match:
-            section = match.group(1)
-            content = match.group(2)
-            # Only add if we haven't seen this section before
-            if section not in section_map:
-                line_obj = Line(section=section, text=content)
-                section_map[section] = line_obj
-                all_sections.append(section)
+    text = LINE_BREAK_PATTERN.sub("\n", text)
+    for match in SECTION_LINE_PATTERN.finditer(text):
+        section = match.group(1)
+        key = parse_section_key(section)
+        # Only add if we haven't seen this section before
+        if key not in section_map:
+            section_map[key] = Line(section=section, text=match.group(2))
 
     # Second pass: Build hierarchy
-    for section in all_sections:
-        line_obj = section_map[section]
-        parts = section.split(".")
+    get_line = section_map.get
+    for key, line_obj in section_map.items():
 
-        if len(parts) == 1:
+        if len(key) == 1:
             # Single number like "000", "100", "101", "200"
-            section_num = int(section)
-            if section_num % 100 == 0:
+            if key[0] % 100 == 0:
                 # Top-level section (000, 100, 200, 300, etc.)
                 top_level_lines.append(line_obj)
-            else:
-                # Subsection of the nearest hundred (e.g., 101 is child of 100)
-                parent_num = (section_num // 100) * 100
-                # Format parent section with leading zeros (e.g., "000", "100")
-                parent_section = f"{parent_num:03d}"
-                if parent_section in section_map:
-                    section_map[parent_section].children.append(line_obj)
-                else:
-                    # Parent not found, add to top level
-                    top_level_lines.append(line_obj)
+                continue
+            # Subsection of the nearest hundred (e.g., 101 is child of 100)
+            parent_key = (key[0] // 100 * 100,)
         else:
             # Has dots, so find parent by removing last component
-            parent_section = ".".join(parts[:-1])
-            if parent_section in section_map:
-                section_map[parent_section].children.append(line_obj)
-            else:
-                # Parent not found, add to top level (orphaned section)
-                top_level_lines.append(line_obj)
+            parent_key = key[:-1]
+
+        parent = get_line(parent_key)
+        if parent is not None:
+            parent.children.append(line_obj)
+        else:
+            # Parent not found, add to top level (orphaned section)
+            top_level_lines.append(line_obj)
 
     return top_level_lines
 
 
-def save_lines_to_files(
-    lines: List[Line], output_dir: str = "../rules_source/crsections"
-):
+def save_lines_to_files(lines: List[Line], output_dir: str = DEFAULT_SECTIONS_DIR):
     """
     Saves each top-level Line object (with all its children) to a separate JSON file.
     Files are named by section number (e.g., "104.json").
 
     Args:
         lines: List of top-level Line objects to save
-        output_dir: Directory path relative to script location
+        output_dir: Directory path, relative to script location unless absolute
     """
-    # Get absolute path relative to this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    abs_output_dir = os.path.join(script_dir, output_dir)
+    # Resolve relative paths against this script; absolute ones pass through
+    abs_output_dir = os.path.join(SCRIPT_DIR, output_dir)
 
     # Create directory if it doesn't exist
     os.makedirs(abs_output_dir, exist_ok=True)
 
     def line_to_dict(line: Line) -> dict:
-        """Recursively convert a Line and all its children to a dict."""
-        return {
-            "section": line.section,
-            "text": line.text,
-            "children": [line_to_dict(child) for child in line.children],
-        }
+        """Convert a Line and all its children to a dict, iterating with a stack."""
+        root = {"section": line.section, "text": line.text, "children": []}
+        stack = [(line, root)]
+        while stack:
+            node, node_dict = stack.pop()
+            for child in node.children:
+                child_dict = {
+                    "section": child.section,
+                    "text": child.text,
+                    "children": [],
+                }
+                node_dict["children"].append(child_dict)
+                stack.append((child, child_dict))
+        return root
 
     # Save each top-level line with all its children to one file
     # Only save sections that are true top-level (N00 format: 000, 100, 200, etc.)
@@ -242,86 +268,126 @@ def save_lines_to_files(
         filename = f"{line.section}.json"
         filepath = os.path.join(abs_output_dir, filename)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(line_dict, f, indent=2, ensure_ascii=False)
+        write_json(filepath, line_dict)
+
+    # Files on disk changed, so previously loaded sections are stale
+    clear_section_cache()
+
+
+@functools.lru_cache(maxsize=None)
+def _read_section_file(filepath: str) -> dict:
+    """Read a section JSON file, caching the parsed dict per path.
+
+    The dict is only ever read by load_line_from_path and must not be handed
+    out, since every later load of the path shares it.
+    """
+    return read_json(filepath)
+
 
+def clear_section_cache():
+    """Forget cached section files, so the next load reads them from disk again."""
+    _read_section_file.cache_clear()
 
-def load_line_from_file(
-    section: str, input_dir: str = "../rules_source/crsections"
-) -> Line:
+
+def load_line_from_path(filepath: str) -> Line:
     """
-    Loads a Line object from a JSON file.
-    Recursively loads children.
+    Loads a Line object, including all of its children, from a JSON file path.
+
+    The parsed file is cached per path, so repeated loads skip the disk read
+    and parse. Each call still builds a new Line tree, so callers may modify
+    what they get back. Call clear_section_cache() after changing section
+    files outside save_lines_to_files.
+
+    Args:
+        filepath: Path to the section JSON file
+
+    Returns:
+        Line object with all children loaded
+    """
+    line_dict = _read_section_file(filepath)
+
+    def dict_to_line(d: dict) -> Line:
+        """Convert dict to Line object, walking the tree with a stack."""
+        root = Line(section=d["section"], text=d["text"])
+        stack = [(d, root)]
+        while stack:
+            node_dict, node = stack.pop()
+            for child_dict in node_dict["children"]:
+                child = Line(section=child_dict["section"], text=child_dict["text"])
+                node.children.append(child)
+                stack.append((child_dict, child))
+        return root
+
+    return dict_to_line(line_dict)
+
+
+def load_line_from_file(section: str, input_dir: str = DEFAULT_SECTIONS_DIR) -> Line:
+    """
+    Loads a Line object from a JSON file, including all of its children.
+    Loads are cached by load_line_from_path.
 
     Args:
         section: Section number (e.g., "104", "104.1")
-        input_dir: Directory path relative to script location
+        input_dir: Directory path, relative to script location unless absolute
 
     Returns:
         Line object with all children loaded
     """
-    # Get absolute path relative to this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    abs_input_dir = os.path.join(script_dir, input_dir)
+    # Resolve relative paths against this script; absolute ones pass through
+    abs_input_dir = os.path.join(SCRIPT_DIR, input_dir)
 
     filename = f"{section}.json"
     filepath = os.path.join(abs_input_dir, filename)
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        line_dict = json.load(f)
-
-    def dict_to_line(d: dict) -> Line:
-        """Recursively convert dict to Line object."""
-        children = [dict_to_line(child) for child in d["children"]]
-        return Line(section=d["section"], text=d["text"], children=children)
-
-    return dict_to_line(line_dict)
+    return load_line_from_path(filepath)
 
 
-def load_all_lines(input_dir: str = "../rules_source/crsections") -> List[Line]:
+def load_all_lines(input_dir: str = DEFAULT_SECTIONS_DIR) -> List[Line]:
     """
     Loads all top-level Line objects from the directory.
 
     Args:
-        input_dir: Directory path relative to script location
+        input_dir: Directory path, relative to script location unless absolute
 
     Returns:
         List of top-level Line objects with all children loaded
     """
-    # Get absolute path relative to this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    abs_input_dir = os.path.join(script_dir, input_dir)
+    # Resolve relative paths against this script; absolute ones pass through
+    abs_input_dir = os.path.join(SCRIPT_DIR, input_dir)
 
     # Find all JSON files
     if not os.path.exists(abs_input_dir):
         return []
 
-    json_files = [f for f in os.listdir(abs_input_dir) if f.endswith(".json")]
-
-    # Extract section numbers and identify top-level (no dots in section number)
+    # Collect (section number, path) for each top-level section file. DirEntry
+    # caches the file type and full path, so no extra stat or join is needed
     top_level_sections = []
-    for filename in json_files:
-        section = filename.replace(".json", "")
-        # Top-level sections have no dots (e.g., "100", "200") or only digits before first dot
-        if "." not in section:
-            top_level_sections.append(section)
+    with os.scandir(abs_input_dir) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.endswith(".json"):
+                continue
+            section = entry.name[:-5]
+            # Skip metadata file
+            if section == "metadata":
+                continue
+            # Top-level sections have no dots (e.g., "100", "200")
+            if "." in section:
+                continue
+            try:
+                top_level_sections.append((int(section), entry.path))
+            except ValueError:
+                continue  # Not a section number, skip
 
     # Sort numerically
-    top_level_sections.sort(key=lambda x: int(x))
+    top_level_sections.sort()
 
     # Load each top-level section
-    lines = []
-    for section in top_level_sections:
-        line = load_line_from_file(section, input_dir)
-        lines.append(line)
-
-    return lines
+    return [load_line_from_path(path) for _, path in top_level_sections]
 
 
 if __name__ == "__main__":
     # Get absolute path to PDF
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    pdf_path = os.path.join(script_dir, "../staticfiles/Riftbound1.2.pdf")
+    pdf_path = os.path.join(SCRIPT_DIR, "../staticfiles/Riftbound1.2.pdf")
 
     # Extract and parse the PDF
     print("Extracting text from PDF...")
@@ -0,0 +1,39 @@
+"""
+JSON helpers shared by the rule and card scripts.
+
+Uses orjson when it is installed (pip install orjson) and the standard json
+module otherwise. Both write the same indented UTF-8 output.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(filepath, data):
+    """Write data as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def read_json(filepath):
+    """Read a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            return orjson.loads(f.read())
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def loads_json(text):
+    """Parse a JSON document held in a string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
@@ -12,11 +12,15 @@ Finds old text and new text for each card, then updates the riftbound_cards.json
 with an "errata_text" field containing the new text.
 
 Requires: pip install pypdf requests
+Optional: pip install pyahocorasick orjson (faster card name matching and JSON I/O)
 """
 
-import json
+import functools
+import os
 import re
+import shutil
 import sys
+from collections import defaultdict
 from html.parser import HTMLParser
 from pathlib import Path
 
@@ -29,6 +33,15 @@ except ImportError:
     print("  pip install pypdf")
     sys.exit(1)
 
+from jsonio import read_json, write_json
+
+# Aho-Corasick matching of errata names against card names is optional;
+# without it partial matches go through a CardNameIndex instead
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 ERRATA_PDFS = [
     {
@@ -51,13 +64,209 @@ ERRATA_PAGES = [
 ]
 
 
+def build_automaton(words):
+    """Build an Aho-Corasick automaton over words.
+
+    Each word maps to an (index, word) tuple, where index is its position in
+    the iteration order of words.
+    """
+    automaton = ahocorasick.Automaton()
+    for index, word in enumerate(words):
+        automaton.add_word(word, (index, word))
+    automaton.make_automaton()
+    return automaton
+
+
+def iter_substring_matches(automaton, text):
+    """Yield the (index, word) value of every automaton word found in text."""
+    # An automaton with no words cannot be searched
+    if automaton.kind != ahocorasick.AHOCORASICK:
+        return
+    for _, value in automaton.iter(text):
+        yield value
+
+
+def scan_card_names(card_name, card_names):
+    """Find the first card name that partially matches an errata name.
+
+    A card matches when its name contains or is contained in the errata name
+    ("partial"), or contains the part of the errata name before a comma
+    ("first part"). Cards are tried in order and the first match wins.
+
+    Returns:
+        tuple: (card name, kind), or None when no card matches
+    """
+    first_part = card_name.split(",")[0].strip() if "," in card_name else None
+    for name in card_names:
+        if card_name in name or name in card_name:
+            return name, "partial"
+        if first_part is not None and first_part in name:
+            return name, "first part"
+    return None
+
+
+# Length of the character n-grams CardNameIndex files card names under
+NGRAM_LENGTH = 3
+
+
+class CardNameIndex:
+    """Card names indexed for partial matching without pyahocorasick.
+
+    Card names are filed under every character n-gram they contain, so only
+    the cards sharing an errata name's rarest n-gram are substring-tested
+    against it. Posting lists keep card order, so the first card found is the
+    one scan_card_names would return.
+    """
+
+    def __init__(self, card_names):
+        self.card_names = list(card_names)
+        self.positions = {}
+        self.postings = defaultdict(list)
+        for index, name in enumerate(self.card_names):
+            self.positions.setdefault(name, index)
+            ngrams = {
+                name[start : start + NGRAM_LENGTH]
+                for start in range(len(name) - NGRAM_LENGTH + 1)
+            }
+            for ngram in ngrams:
+                self.postings[ngram].append(index)
+        self.lengths = sorted({len(name) for name in self.positions})
+
+    def contained_in(self, text):
+        """Return the indexes of card names that occur in text."""
+        found = set()
+        for length in self.lengths:
+            if length > len(text):
+                break
+            for start in range(len(text) - length + 1):
+                index = self.positions.get(text[start : start + length])
+                if index is not None:
+                    found.add(index)
+        return found
+
+    def first_containing(self, key):
+        """Return the index of the first card name containing key, or None."""
+        if len(key) < NGRAM_LENGTH:
+            # Too short to have an n-gram; check every card in order
+            candidates = range(len(self.card_names))
+        else:
+            candidates = min(
+                (
+                    self.postings.get(key[start : start + NGRAM_LENGTH], ())
+                    for start in range(len(key) - NGRAM_LENGTH + 1)
+                ),
+                key=len,
+            )
+        for index in candidates:
+            if key in self.card_names[index]:
+                return index
+        return None
+
+    def find(self, card_name):
+        """Same as scan_card_names(card_name, card_names), using the index."""
+        partial = self.contained_in(card_name)
+        containing = self.first_containing(card_name)
+        if containing is not None:
+            partial.add(containing)
+        candidates = set(partial)
+        if "," in card_name:
+            first_part = self.first_containing(card_name.split(",")[0].strip())
+            if first_part is not None:
+                candidates.add(first_part)
+        if not candidates:
+            return None
+        index = min(candidates)
+        kind = "partial" if index in partial else "first part"
+        return self.card_names[index], kind
+
+
+def find_partial_matches(card_names, errata_names):
+    """Find the partial match for each errata name that is not a card name.
+
+    Gives the same result as calling scan_card_names for each errata name, but
+    with pyahocorasick installed each name is matched through two automata,
+    and through a CardNameIndex otherwise, instead of being substring-tested
+    against every card name.
+
+    Args:
+        card_names: Normalized card names, in matching order
+        errata_names: Normalized errata card names
+
+    Returns:
+        dict: Errata name -> (card name, kind) for every name with a match
+    """
+    card_names = list(card_names)
+    known = set(card_names)
+    pending = [name for name in dict.fromkeys(errata_names) if name not in known]
+
+    if ahocorasick is None:
+        index = CardNameIndex(card_names)
+        matches = {}
+        for card_name in pending:
+            match = index.find(card_name)
+            if match is not None:
+                matches[card_name] = match
+        return matches
+
+    # Card names contained in an errata name
+    card_automaton = build_automaton(card_names)
+
+    # Reverse direction: which card names contain an errata name, or the part
+    # of it before a comma
+    errata_keys = set(pending)
+    for card_name in pending:
+        if "," in card_name:
+            errata_keys.add(card_name.split(",")[0].strip())
+    errata_automaton = build_automaton(sorted(errata_keys))
+    containing_cards = defaultdict(set)
+    for index, name in enumerate(card_names):
+        for _, key in iter_substring_matches(errata_automaton, name):
+            containing_cards[key].add(index)
+
+    def containing(key):
+        # The automaton cannot hold an empty key; it is in every card name
+        if not key:
+            return set(range(len(card_names)))
+        return containing_cards.get(key, set())
+
+    matches = {}
+    for card_name in pending:
+        partial = {
+            index for index, _ in iter_substring_matches(card_automaton, card_name)
+        }
+        partial |= containing(card_name)
+        candidates = set(partial)
+        if "," in card_name:
+            candidates |= containing(card_name.split(",")[0].strip())
+        if candidates:
+            # Same winner as the in-order scan: the earliest matching card,
+            # reported as partial whenever that card matches both ways
+            index = min(candidates)
+            kind = "partial" if index in partial else "first part"
+            matches[card_name] = (card_names[index], kind)
+    return matches
+
+
 def download_pdf(url, output_path):
-    """Download a PDF file."""
+    """Download a PDF file, streaming it to disk rather than buffering it in memory.
+
+    The PDF is streamed to a temporary file next to output_path and moved into
+    place once complete, so a failed download never leaves a truncated PDF.
+    """
     print(f"  Downloading: {url}")
-    response = requests.get(url, timeout=60)
-    response.raise_for_status()
-    with open(output_path, "wb") as f:
-        f.write(response.content)
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with requests.get(url, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            # Let urllib3 undo any gzip/deflate Content-Encoding while copying
+            response.raw.decode_content = True
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=65536)
+        os.replace(tmp_path, output_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
     print(f"  Saved to: {output_path}")
     return output_path
 
@@ -71,6 +280,22 @@ def extract_text_from_pdf(pdf_path):
     return text
 
 
+# Classifies a PDF errata line by its leading marker. Alternatives are
+# mutually exclusive, so match.lastgroup names the kind of line:
+#   new / old  - "[NEW TEXT]" / "[OLD TEXT]" entries
+#   marker     - a bare "▲" separator
+#   header     - page furniture that ends an [OLD TEXT] block
+#   note       - other lines that are never card names
+_ERRATA_LINE = re.compile(
+    r"^(?:(?P<new>\[NEW\s*TEXT\])"
+    r"|(?P<old>\[OLD\s*TEXT\])"
+    r"|(?P<marker>▲$)"
+    r"|(?P<header>Page\s*\d+|ERRATA|CARD\s*ERRATA|Riftbound\s*Card\s*Errata|Last\s*Updated)"
+    r"|(?P<note>Riftbound|Note:))",
+    re.IGNORECASE,
+)
+
+
 def parse_errata_from_text(text):
     """Parse errata entries from PDF text.
 
@@ -85,101 +310,85 @@ def parse_errata_from_text(text):
     # Split into lines and clean
     lines = [line.strip() for line in text.split("\n") if line.strip()]
 
+    # Classify every line once; kinds[i] is None for ordinary text lines and
+    # rests[i] holds the text following a [NEW TEXT]/[OLD TEXT] marker
+    kinds = []
+    rests = []
+    for line in lines:
+        match = _ERRATA_LINE.match(line)
+        if match:
+            kinds.append(match.lastgroup)
+            rests.append(line[match.end() :].strip())
+        else:
+            kinds.append(None)
+            rests.append(line)
+
     i = 0
     while i < len(lines):
-        line = lines[i]
-
         # Look for "[NEW TEXT]" pattern
-        new_match = re.match(r"^\[NEW\s*TEXT\]\s*(.*)$", line, re.IGNORECASE)
-        if new_match:
-            new_text = new_match.group(1).strip()
-
-            # Collect continuation lines until we hit [OLD TEXT] or ▲
-            j = i + 1
-            while j < len(lines):
-                next_line = lines[j]
-                if re.match(r"^\[(NEW|OLD)\s*TEXT\]", next_line, re.IGNORECASE):
-                    break
-                if next_line == "▲":
-                    j += 1  # Skip the ▲ marker
-                    break
-                new_text += " " + next_line
-                j += 1
-
-            # Now look for "[OLD TEXT]"
-            if j < len(lines):
-                old_match = re.match(
-                    r"^\[OLD\s*TEXT\]\s*(.*)$", lines[j], re.IGNORECASE
-                )
-                if old_match:
-                    old_text = old_match.group(1).strip()
-
-                    # Collect continuation lines until next card (next [NEW TEXT])
-                    k = j + 1
-                    while k < len(lines):
-                        next_line = lines[k]
-                        if re.match(r"^\[NEW\s*TEXT\]", next_line, re.IGNORECASE):
-                            break
-                        # Stop at page markers or section headers
-                        if re.match(
-                            r"^(Page\s*\d+|ERRATA|CARD\s*ERRATA|Riftbound\s*Card\s*Errata|Last\s*Updated)",
-                            next_line,
-                            re.IGNORECASE,
-                        ):
-                            break
-                        # Skip ▲ markers
-                        if next_line == "▲":
-                            k += 1
-                            continue
-                        # Check if this is a new card name (line before [NEW TEXT])
-                        if k + 1 < len(lines) and re.match(
-                            r"^\[NEW\s*TEXT\]", lines[k + 1], re.IGNORECASE
-                        ):
-                            break
-                        old_text += " " + next_line
-                        k += 1
-
-                    # Look backwards to find the card name
-                    # Card name is the line immediately before [NEW TEXT]
-                    card_name = None
-                    for back in range(i - 1, max(i - 5, -1), -1):
-                        potential = lines[back]
-                        # Skip markers, headers, and other errata text
-                        if re.match(r"^\[(OLD|NEW)\s*TEXT\]", potential, re.IGNORECASE):
-                            continue
-                        if potential == "▲":
-                            continue
-                        if re.match(
-                            r"^(Page\s*\d+|ERRATA|CARD\s*ERRATA|Riftbound|Last\s*Updated|Note:)",
-                            potential,
-                            re.IGNORECASE,
-                        ):
-                            continue
-                        if len(potential) > 100:
-                            continue
-                        # Found a good candidate
-                        card_name = potential
-                        break
-
-                    if card_name and new_text:
-                        # Clean up the texts - remove extra spaces
-                        old_text = re.sub(r"\s+", " ", old_text).strip()
-                        new_text = re.sub(r"\s+", " ", new_text).strip()
-                        # Clean up card name
-                        card_name = re.sub(r"\s+", " ", card_name).strip()
-
-                        errata_entries.append(
-                            {
-                                "card_name": card_name,
-                                "old_text": old_text,
-                                "new_text": new_text,
-                            }
-                        )
-
-                    i = k
-                    continue
+        if kinds[i] != "new":
+            i += 1
+            continue
+        new_parts = [rests[i]]
 
-        i += 1
+        # Collect continuation lines until we hit [OLD TEXT] or ▲
+        j = i + 1
+        while j < len(lines):
+            if kinds[j] in ("new", "old"):
+                break
+            if kinds[j] == "marker":
+                j += 1  # Skip the ▲ marker
+                break
+            new_parts.append(lines[j])
+            j += 1
+
+        # Now look for "[OLD TEXT]"
+        if j >= len(lines) or kinds[j] != "old":
+            i += 1
+            continue
+        old_parts = [rests[j]]
+
+        # Collect continuation lines until next card (next [NEW TEXT])
+        k = j + 1
+        while k < len(lines):
+            # Stop at the next entry, page markers or section headers
+            if kinds[k] in ("new", "header"):
+                break
+            # Skip ▲ markers
+            if kinds[k] == "marker":
+                k += 1
+                continue
+            # Check if this is a new card name (line before [NEW TEXT])
+            if k + 1 < len(lines) and kinds[k + 1] == "new":
+                break
+            old_parts.append(lines[k])
+            k += 1
+
+        # Look backwards to find the card name
+        # Card name is the line immediately before [NEW TEXT]
+        card_name = None
+        for back in range(i - 1, max(i - 5, -1), -1):
+            # Skip markers, headers, and other errata text
+            if kinds[back] is not None:
+                continue
+            if len(lines[back]) > 100:
+                continue
+            # Found a good candidate
+            card_name = lines[back]
+            break
+
+        # Clean up the texts - collapse runs of whitespace to single spaces
+        new_text = " ".join(" ".join(new_parts).split())
+        if card_name and new_text:
+            errata_entries.append(
+                {
+                    "card_name": " ".join(card_name.split()),
+                    "old_text": " ".join(" ".join(old_parts).split()),
+                    "new_text": new_text,
+                }
+            )
+
+        i = k
 
     return errata_entries
 
@@ -266,9 +475,9 @@ def parse_errata_from_webpage(text):
                     old_text = old_match.group(1).strip().strip('"“”')
                     entries.append(
                         {
-                            "card_name": re.sub(r"\s+", " ", card_name).strip(),
-                            "new_text": re.sub(r"\s+", " ", new_text).strip(),
-                            "old_text": re.sub(r"\s+", " ", old_text).strip(),
+                            "card_name": " ".join(card_name.split()),
+                            "new_text": " ".join(new_text.split()),
+                            "old_text": " ".join(old_text.split()),
                         }
                     )
                     i += 2
@@ -279,6 +488,17 @@ def parse_errata_from_webpage(text):
     return entries
 
 
+@functools.lru_cache(maxsize=8192)
+def normalize_name(name):
+    """Normalize card name for matching - handle apostrophes and spacing."""
+    name = name.lower()
+    # Replace various apostrophe types with standard one (using Unicode code points)
+    # U+2019 RIGHT SINGLE QUOTATION MARK, U+2018 LEFT SINGLE QUOTATION MARK
+    name = name.replace("\u2019", "'").replace("\u2018", "'").replace("`", "'")
+    # Strip and normalize whitespace (collapse multiple spaces to single)
+    return " ".join(name.split())
+
+
 def main():
     print("Riftbound Errata PDF Parser")
     print("=" * 40)
@@ -292,29 +512,18 @@ def main():
         print(f"ERROR: {cards_file} not found. Run scrape_cards.py first.")
         sys.exit(1)
 
-    with open(cards_file, "r", encoding="utf-8") as f:
-        cards = json.load(f)
+    cards = read_json(cards_file)
 
     print(f"Loaded {len(cards)} cards from {cards_file}")
 
-    def normalize_name(name):
-        """Normalize card name for matching - handle apostrophes and spacing."""
-        name = name.lower().strip()
-        # Replace various apostrophe types with standard one (using Unicode code points)
-        # U+2019 RIGHT SINGLE QUOTATION MARK, U+2018 LEFT SINGLE QUOTATION MARK
-        name = name.replace("\u2019", "'").replace("\u2018", "'").replace("`", "'")
-        # Normalize whitespace (collapse multiple spaces to single)
-        name = re.sub(r"\s+", " ", name)
-        return name
-
     # Create a lookup by card name (lowercase for matching)
-    cards_by_name = {}
+    cards_by_name = defaultdict(list)
     for card in cards:
         name = normalize_name(card.get("name", ""))
         if name:
-            if name not in cards_by_name:
-                cards_by_name[name] = []
             cards_by_name[name].append(card)
+    # Freeze it so later lookups can't insert empty entries
+    cards_by_name = dict(cards_by_name)
 
     # Download and parse errata PDFs
     all_errata = []
@@ -400,45 +609,34 @@ def main():
     matched = 0
     unmatched = []
 
-    for errata in all_errata:
-        card_name = normalize_name(errata["card_name"])
+    # Normalize each errata name once up front
+    errata_names = [normalize_name(errata["card_name"]) for errata in all_errata]
+    partial_matches = find_partial_matches(cards_by_name, errata_names)
 
+    def apply_errata(card_list, errata):
+        for card in card_list:
+            card["errata_text"] = errata["new_text"]
+            card["errata_old_text"] = errata["old_text"]
+
+    for errata, card_name in zip(all_errata, errata_names):
         # Try exact match first
         if card_name in cards_by_name:
-            for card in cards_by_name[card_name]:
-                card["errata_text"] = errata["new_text"]
-                card["errata_old_text"] = errata["old_text"]
+            apply_errata(cards_by_name[card_name], errata)
             matched += 1
             print(f"  Matched: {errata['card_name']}")
-        else:
-            # Try partial match (card name might have subtitle like "Ahri, Alluring")
-            found = False
-            for name, card_list in cards_by_name.items():
-                # Check if the errata card name is contained in or contains the JSON card name
-                if card_name in name or name in card_name:
-                    for card in card_list:
-                        card["errata_text"] = errata["new_text"]
-                        card["errata_old_text"] = errata["old_text"]
-                    matched += 1
-                    found = True
-                    print(f"  Matched (partial): {errata['card_name']} -> {name}")
-                    break
-                # Also try matching just the first part before comma
-                if "," in card_name:
-                    first_part = card_name.split(",")[0].strip()
-                    if first_part in name or name.startswith(first_part):
-                        for card in card_list:
-                            card["errata_text"] = errata["new_text"]
-                            card["errata_old_text"] = errata["old_text"]
-                        matched += 1
-                        found = True
-                        print(
-                            f"  Matched (first part): {errata['card_name']} -> {name}"
-                        )
-                        break
-
-            if not found:
-                unmatched.append(errata["card_name"])
+            continue
+
+        # Then a partial match (card name might have subtitle like "Ahri, Alluring")
+        # or a match on just the first part before a comma
+        match = partial_matches.get(card_name)
+        if match is not None:
+            name, kind = match
+            apply_errata(cards_by_name[name], errata)
+            matched += 1
+            print(f"  Matched ({kind}): {errata['card_name']} -> {name}")
+            continue
+
+        unmatched.append(errata["card_name"])
 
     print(f"\nMatched {matched} errata entries to cards")
 
@@ -450,8 +648,7 @@ def main():
     # Apply manual overrides (errata not in any PDF, matched by card id)
     overrides_file = script_dir / "manual_errata_overrides.json"
     if overrides_file.exists():
-        with open(overrides_file, "r", encoding="utf-8") as f:
-            overrides = json.load(f)
+        overrides = read_json(overrides_file)
         cards_by_id = {card["id"]: card for card in cards}
         override_count = 0
         for override in overrides:
@@ -466,8 +663,7 @@ def main():
         print(f"Applied {override_count} manual override(s) from {overrides_file.name}")
 
     # Save updated cards
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(cards, f, indent=2, ensure_ascii=False)
+    write_json(output_file, cards)
 
     print(f"\nSaved updated cards to {output_file}")
 
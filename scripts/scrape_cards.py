@@ -5,198 +5,236 @@ https://riftbound.leagueoflegends.com/en-us/card-gallery/
 Collects: Energy, Power, Might, Domain, Card Type, Ability, Rarity, Card Set, and Image URL
 for each card and saves to a JSON file.
 
-Requires: pip install playwright
-Then run: playwright install chromium
+The gallery is a Next.js page, so all card data ships in the __NEXT_DATA__
+script of the initial HTML and a plain HTTP request is enough.
+
+Requires: pip install requests
+For --fallback (render the page in a headless browser instead):
+    pip install playwright
+    playwright install chromium
 """
 
+import argparse
 import asyncio
 import json
 import re
 import sys
 from pathlib import Path
 
+import requests
+
+from jsonio import loads_json, write_json
+
 try:
     from playwright.async_api import async_playwright
 except ImportError:
-    print("Playwright is required. Install it with:")
-    print("  pip install playwright")
-    print("  playwright install chromium")
-    sys.exit(1)
+    async_playwright = None
+
+
+GALLERY_URL = "https://riftbound.leagueoflegends.com/en-us/card-gallery/"
+
+# Browser-like User-Agent; some CDNs reject the default python-requests one
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+# Resource types the --fallback browser skips; only __NEXT_DATA__ is needed
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# A run of HTML tags and whitespace, collapsed to one space by strip_html
+HTML_TAGS_AND_WHITESPACE = re.compile(r"(?:<[^>]+>|\s)+")
+
+# The JSON payload Next.js embeds in the initial HTML response
+NEXT_DATA_PATTERN = re.compile(
+    r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+)
 
 
 def strip_html(html_text):
     """Remove HTML tags from text."""
     if not html_text:
         return ""
-    # Remove HTML tags
-    clean = re.sub(r"<[^>]+>", " ", html_text)
-    # Normalize whitespace
-    clean = re.sub(r"\s+", " ", clean)
-    return clean.strip()
+    # Replace tags with a space and normalize whitespace in one pass
+    return HTML_TAGS_AND_WHITESPACE.sub(" ", html_text).strip()
+
+
+def _numeric_value(data):
+    """Numeric fields look like {'label': 'Energy', 'value': {'id': 1, 'label': '1'}}."""
+    if isinstance(data, dict):
+        value = data.get("value", {})
+        if isinstance(value, dict):
+            return value.get("id")
+        return value
+    return data
+
+
+def _option_label(option):
+    """Label of a selected option, falling back to its id."""
+    return option.get("label", option.get("id", ""))
+
+
+def _domain(data):
+    """One domain label, or a list of them for multi-domain cards."""
+    if isinstance(data, dict):
+        if "values" in data and data["values"]:
+            domains = [_option_label(v) for v in data["values"]]
+            return domains[0] if len(domains) == 1 else domains
+        elif "value" in data:
+            return _option_label(data["value"])
+    return None
+
+
+def _card_type(data):
+    """One card type label, or a list of them."""
+    if isinstance(data, dict):
+        if "type" in data:
+            types = data["type"]
+            if isinstance(types, list):
+                type_labels = [_option_label(t) for t in types]
+                return type_labels[0] if len(type_labels) == 1 else type_labels
+        elif "value" in data:
+            return data["value"].get("label", "")
+    return None
+
+
+def _selected_label(data):
+    """Rarity and set are single-select fields: {'value': {'id': ..., 'label': ...}}."""
+    if isinstance(data, dict) and "value" in data:
+        return _option_label(data["value"])
+    return None
+
+
+def _image_url(data):
+    if isinstance(data, dict) and "url" in data:
+        return data["url"]
+    return None
+
+
+def _ability(data):
+    """Ability text, extracted from the richText HTML."""
+    if isinstance(data, dict):
+        rich_text = data.get("richText", {})
+        if isinstance(rich_text, dict) and "body" in rich_text:
+            return strip_html(rich_text["body"])
+    return None
+
+
+def _gear_effect(data):
+    """Separate effect text present on Gear cards, in one of several shapes."""
+    if isinstance(data, dict):
+        rich_text = data.get("richText", {})
+        if isinstance(rich_text, dict) and "body" in rich_text:
+            return strip_html(rich_text["body"])
+        elif "body" in data:
+            return strip_html(data["body"])
+        elif isinstance(data.get("value"), str):
+            return data["value"]
+    elif isinstance(data, str):
+        return data
+    return None
+
+
+def _tags(data):
+    """Tags look like {"label": "Tags", "tags": ["ChampionName", ...]}, or a bare list."""
+    if isinstance(data, dict) and "tags" in data:
+        return data["tags"]
+    elif isinstance(data, list):
+        return data
+    return None
+
+
+# (raw keys, card key, extractor) for each field read off a raw card, in output
+# order. When several raw keys are listed, the first one present is used; e.g.
+# Might Bonus is stored under "might" or "mightBonus" on Gear cards.
+CARD_FIELDS = (
+    (("energy",), "energy", _numeric_value),
+    (("power",), "power", _numeric_value),
+    (("might", "mightBonus"), "might_bonus", _numeric_value),
+    (("domain",), "domain", _domain),
+    (("cardType",), "card_type", _card_type),
+    (("rarity",), "rarity", _selected_label),
+    (("set",), "card_set", _selected_label),
+    (("cardImage",), "image_url", _image_url),
+    (("text",), "ability", _ability),
+    (("effect", "gearEffect", "gearText", "cardEffect"), "gear_effect", _gear_effect),
+    (("tags",), "tags", _tags),
+)
+
+# Every raw key extract_card_data understands
+KNOWN_KEYS = {"id", "name", "collectorNumber"}.union(
+    *(raw_keys for raw_keys, _, _ in CARD_FIELDS)
+)
 
 
 def extract_card_data(raw_card):
-    """Extract relevant fields from a raw card object."""
+    """Extract relevant fields from a raw card object. Missing or null fields are left out."""
     card = {
         "id": raw_card.get("id", ""),
         "name": raw_card.get("name", ""),
-        "collector_number": raw_card.get("collectorNumber"),
     }
-
-    # Energy (cost) - extract numeric value from nested structure
-    if "energy" in raw_card:
-        energy_data = raw_card["energy"]
-        if isinstance(energy_data, dict):
-            # Structure is: {'label': 'Energy', 'value': {'id': 1, 'label': '1'}}
-            value = energy_data.get("value", {})
-            if isinstance(value, dict):
-                card["energy"] = value.get("id")
-            else:
-                card["energy"] = value
-        else:
-            card["energy"] = energy_data
-
-    # Power - extract numeric value from nested structure
-    if "power" in raw_card:
-        power_data = raw_card["power"]
-        if isinstance(power_data, dict):
-            value = power_data.get("value", {})
-            if isinstance(value, dict):
-                card["power"] = value.get("id")
-            else:
-                card["power"] = value
-        else:
-            card["power"] = power_data
-
-    # Might Bonus - present on Gear cards; try both "might" and "mightBonus" keys
-    for might_key in ("might", "mightBonus"):
-        if might_key in raw_card:
-            might_data = raw_card[might_key]
-            if isinstance(might_data, dict):
-                value = might_data.get("value", {})
-                if isinstance(value, dict):
-                    card["might_bonus"] = value.get("id")
-                else:
-                    card["might_bonus"] = value
-            else:
-                card["might_bonus"] = might_data
-            break
-
-    # Domain
-    if "domain" in raw_card:
-        domain_data = raw_card["domain"]
-        if isinstance(domain_data, dict):
-            if "values" in domain_data and domain_data["values"]:
-                domains = [
-                    v.get("label", v.get("id", "")) for v in domain_data["values"]
-                ]
-                card["domain"] = domains[0] if len(domains) == 1 else domains
-            elif "value" in domain_data:
-                card["domain"] = domain_data["value"].get(
-                    "label", domain_data["value"].get("id", "")
-                )
-
-    # Card Type
-    if "cardType" in raw_card:
-        card_type_data = raw_card["cardType"]
-        if isinstance(card_type_data, dict):
-            if "type" in card_type_data:
-                types = card_type_data["type"]
-                if isinstance(types, list):
-                    type_labels = [t.get("label", t.get("id", "")) for t in types]
-                    card["card_type"] = (
-                        type_labels[0] if len(type_labels) == 1 else type_labels
-                    )
-            elif "value" in card_type_data:
-                card["card_type"] = card_type_data["value"].get("label", "")
-
-    # Rarity
-    if "rarity" in raw_card:
-        rarity_data = raw_card["rarity"]
-        if isinstance(rarity_data, dict) and "value" in rarity_data:
-            card["rarity"] = rarity_data["value"].get(
-                "label", rarity_data["value"].get("id", "")
-            )
-
-    # Card Set
-    if "set" in raw_card:
-        set_data = raw_card["set"]
-        if isinstance(set_data, dict) and "value" in set_data:
-            card["card_set"] = set_data["value"].get(
-                "label", set_data["value"].get("id", "")
-            )
-
-    # Card Image URL
-    if "cardImage" in raw_card:
-        img_data = raw_card["cardImage"]
-        if isinstance(img_data, dict) and "url" in img_data:
-            card["image_url"] = img_data["url"]
-
-    # Ability/Text - extract from richText HTML
-    if "text" in raw_card:
-        text_data = raw_card["text"]
-        if isinstance(text_data, dict):
-            rich_text = text_data.get("richText", {})
-            if isinstance(rich_text, dict) and "body" in rich_text:
-                card["ability"] = strip_html(rich_text["body"])
-
-    # Gear Effect - separate text field present on Gear cards
-    for effect_key in ("effect", "gearEffect", "gearText", "cardEffect"):
-        if effect_key in raw_card:
-            effect_data = raw_card[effect_key]
-            if isinstance(effect_data, dict):
-                rich_text = effect_data.get("richText", {})
-                if isinstance(rich_text, dict) and "body" in rich_text:
-                    card["gear_effect"] = strip_html(rich_text["body"])
-                elif "body" in effect_data:
-                    card["gear_effect"] = strip_html(effect_data["body"])
-                elif isinstance(effect_data.get("value"), str):
-                    card["gear_effect"] = effect_data["value"]
-            elif isinstance(effect_data, str):
-                card["gear_effect"] = effect_data
-            break
-
-    # Tags - structure is {"label": "Tags", "tags": ["ChampionName", ...]}
-    if "tags" in raw_card:
-        tag_data = raw_card["tags"]
-        if isinstance(tag_data, dict) and "tags" in tag_data:
-            card["tags"] = tag_data["tags"]
-        elif isinstance(tag_data, list):
-            card["tags"] = tag_data
+    collector_number = raw_card.get("collectorNumber")
+    if collector_number is not None:
+        card["collector_number"] = collector_number
+
+    for raw_keys, key, extract in CARD_FIELDS:
+        for raw_key in raw_keys:
+            if raw_key in raw_card:
+                value = extract(raw_card[raw_key])
+                if value is not None:
+                    card[key] = value
+                break
 
     # Debug: report unrecognized keys on Gear cards so field names can be verified
     if card.get("card_type") == "Gear":
-        known_keys = {
-            "id", "name", "collectorNumber", "energy", "power", "might",
-            "mightBonus", "domain", "cardType", "rarity", "set", "cardImage",
-            "text", "tags", "effect", "gearEffect", "gearText", "cardEffect",
-        }
-        unexpected = set(raw_card.keys()) - known_keys
+        unexpected = set(raw_card.keys()) - KNOWN_KEYS
         if unexpected:
-            print(f"  [Gear card '{raw_card.get('name', '?')}'] unexpected keys: {unexpected}")
+            print(
+                f"  [Gear card '{raw_card.get('name', '?')}'] unexpected keys: {unexpected}"
+            )
 
     # Legend name: prepend champion tag so name becomes "Ahri, Nine-Tailed Fox"
     if card.get("card_type") == "Legend" and len(card.get("tags", [])) == 1:
         card["name"] = f"{card['tags'][0]}, {card['name']}"
 
-    # Remove None values
-    card = {k: v for k, v in card.items() if v is not None}
+    # Remove None values (only id and name are stored unconditionally)
+    if card["id"] is None:
+        del card["id"]
+    if card["name"] is None:
+        del card["name"]
 
     return card
 
 
-async def scrape_cards():
-    """Scrape all card data from the Riftbound card gallery."""
+def fetch_next_data(url=GALLERY_URL):
+    """Fetch the gallery page over HTTP and return the raw __NEXT_DATA__ JSON text."""
+    print("Fetching card gallery...")
+    response = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=60)
+    response.raise_for_status()
 
-    async with async_playwright() as p:
-        print("Launching browser...")
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(viewport={"width": 1920, "height": 1080})
+    print("Extracting card data from page...")
+    match = NEXT_DATA_PATTERN.search(response.text)
+    return match.group(1) if match else None
+
+
+async def _block_static_assets(route):
+    """Playwright route handler: only the page HTML is needed, so drop assets."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def read_next_data(browser, url=GALLERY_URL):
+    """Open url in a fresh context of an already running browser and return __NEXT_DATA__."""
+    context = await browser.new_context(viewport={"width": 1920, "height": 1080})
+    try:
+        await context.route("**/*", _block_static_assets)
         page = await context.new_page()
 
         print("Navigating to card gallery...")
         await page.goto(
-            "https://riftbound.leagueoflegends.com/en-us/card-gallery/",
+            url,
             wait_until="domcontentloaded",
             timeout=60000,
         )
@@ -207,57 +245,121 @@ async def scrape_cards():
 
         # Extract __NEXT_DATA__ which contains all card information
         print("Extracting card data from page...")
-        next_data = await page.evaluate("""() => {
+        return await page.evaluate("""() => {
             const script = document.querySelector('script#__NEXT_DATA__');
             if (script) {
                 return script.textContent;
             }
             return null;
         }""")
+    finally:
+        await context.close()
 
-        await browser.close()
 
-        if not next_data:
-            print("ERROR: Could not find __NEXT_DATA__ on page")
-            return []
+async def fetch_next_data_with_browser(url=GALLERY_URL, browser=None, cdp_url=None):
+    """
+    Render the gallery page in headless Chromium and return the __NEXT_DATA__ text.
 
-        data = json.loads(next_data)
+    Pass a running browser to reuse it across calls (only a new context is opened),
+    or cdp_url to attach to a shared Chromium started with --remote-debugging-port.
+    """
+    if async_playwright is None:
+        print("Playwright is required for --fallback. Install it with:")
+        print("  pip install playwright")
+        print("  playwright install chromium")
+        sys.exit(1)
 
-        # Navigate to the card gallery blade
-        blades = (
-            data.get("props", {}).get("pageProps", {}).get("page", {}).get("blades", [])
-        )
+    if browser is not None:
+        return await read_next_data(browser, url)
 
-        card_gallery_blade = None
-        for blade in blades:
-            if blade.get("type") == "riftboundCardGallery":
-                card_gallery_blade = blade
-                break
+    async with async_playwright() as p:
+        if cdp_url:
+            print(f"Connecting to browser at {cdp_url}...")
+            browser = await p.chromium.connect_over_cdp(cdp_url)
+        else:
+            print("Launching browser...")
+            browser = await p.chromium.launch(headless=True)
+        try:
+            return await read_next_data(browser, url)
+        finally:
+            # For a CDP connection this only disconnects; the shared browser keeps running
+            await browser.close()
+
+
+def find_gallery_cards(next_data):
+    """
+    Return the raw card list from the __NEXT_DATA__ JSON text, or None when the
+    page has no riftboundCardGallery blade.
+    """
+    data = loads_json(next_data)
+
+    # Navigate to the card gallery blade
+    blades = (
+        data.get("props", {}).get("pageProps", {}).get("page", {}).get("blades", [])
+    )
+
+    card_gallery_blade = None
+    for blade in blades:
+        if blade.get("type") == "riftboundCardGallery":
+            card_gallery_blade = blade
+            break
 
-        if not card_gallery_blade:
-            print("ERROR: Could not find riftboundCardGallery blade")
-            return []
+    if not card_gallery_blade:
+        return None
 
-        # Get raw cards from the blade
-        raw_cards = card_gallery_blade.get("cards", {}).get("items", [])
-        print(f"Found {len(raw_cards)} cards in data")
+    # Get raw cards from the blade
+    return card_gallery_blade.get("cards", {}).get("items", [])
+
+
+def scrape_cards(use_browser=False, cdp_url=None):
+    """Scrape all card data from the Riftbound card gallery."""
+    if use_browser:
+        next_data = asyncio.run(fetch_next_data_with_browser(cdp_url=cdp_url))
+    else:
+        next_data = fetch_next_data()
 
-        # Extract and clean card data
-        cards = []
-        for raw_card in raw_cards:
-            card = extract_card_data(raw_card)
-            cards.append(card)
+    if not next_data:
+        print("ERROR: Could not find __NEXT_DATA__ on page")
+        if not use_browser:
+            print("Try again with --fallback to render the page in a browser")
+        return []
 
-        return cards
+    raw_cards = find_gallery_cards(next_data)
+    if raw_cards is None:
+        print("ERROR: Could not find riftboundCardGallery blade")
+        return []
+
+    print(f"Found {len(raw_cards)} cards in data")
+
+    # Extract and clean card data
+    cards = []
+    for raw_card in raw_cards:
+        card = extract_card_data(raw_card)
+        cards.append(card)
+
+    return cards
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Scrape the Riftbound card gallery")
+    parser.add_argument(
+        "--fallback",
+        action="store_true",
+        help="Render the gallery in headless Chromium (Playwright) instead of fetching it over HTTP",
+    )
+    parser.add_argument(
+        "--cdp-url",
+        help="Render the gallery in a running Chromium (e.g. http://localhost:9222) instead of launching one; implies --fallback",
+    )
+    args = parser.parse_args()
+
     print("Riftbound Card Gallery Scraper")
     print("=" * 40)
 
-    # Run the async scraper
-    cards = asyncio.run(scrape_cards())
+    # Attaching to a browser only makes sense on the browser path
+    use_browser = args.fallback or args.cdp_url is not None
+    cards = scrape_cards(use_browser=use_browser, cdp_url=args.cdp_url)
 
     if not cards:
         print("\nNo cards were scraped.")
@@ -267,25 +369,30 @@ def main():
     script_dir = Path(__file__).parent
     output_file = script_dir / "riftbound_cards.json"
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(cards, f, indent=2, ensure_ascii=False)
+    write_json(output_file, cards)
 
     print(f"\nSaved {len(cards)} cards to {output_file}")
 
-    # Print stats
-    cards_with_energy = sum(1 for c in cards if "energy" in c)
-    cards_with_power = sum(1 for c in cards if "power" in c)
-    cards_with_might = sum(1 for c in cards if "might_bonus" in c)
-    cards_with_gear_effect = sum(1 for c in cards if "gear_effect" in c)
-    cards_with_ability = sum(1 for c in cards if "ability" in c)
+    # Print stats: count field coverage and collect unique domains, types,
+    # sets and rarities in a single pass over the cards
+    cards_with_energy = 0
+    cards_with_power = 0
+    cards_with_might = 0
+    cards_with_gear_effect = 0
+    cards_with_ability = 0
 
-    # Count unique domains, types, sets, rarities
     domains = set()
     card_types = set()
     card_sets = set()
     rarities = set()
 
     for c in cards:
+        cards_with_energy += "energy" in c
+        cards_with_power += "power" in c
+        cards_with_might += "might_bonus" in c
+        cards_with_gear_effect += "gear_effect" in c
+        cards_with_ability += "ability" in c
+
         if "domain" in c:
             d = c["domain"]
             if isinstance(d, list):
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from cr_parse import (
+    Line,
+    clear_section_cache,
+    load_line_from_file,
+    parse_lines_to_objects,
+    save_lines_to_files,
+)
+
+
+@pytest.fixture
+def sample_text():
+    """Fixture providing a small piece of core rules text."""
+    return """100. Game Concepts
+101. Deck Construction
+101.1. Each player needs a Champion Legend.
+101.1.a. The Champion Legend determines your Domain Identity.
+200. Setup"""
+
+
+@pytest.fixture
+def parsed_result(sample_text):
+    """Fixture providing parsed Line objects."""
+    return parse_lines_to_objects(sample_text)
+
+
+def test_loaded_trees_are_independent(parsed_result, tmp_path):
+    """Test that changing one loaded tree does not leak into later loads."""
+    save_lines_to_files(parsed_result, str(tmp_path))
+
+    first = load_line_from_file("100", str(tmp_path))
+    first.children.clear()
+
+    assert [c.section for c in load_line_from_file("100", str(tmp_path)).children] == [
+        "101"
+    ]
+
+
+def test_clear_section_cache_reloads_changed_files(parsed_result, tmp_path):
+    """Test that clear_section_cache picks up files changed on disk."""
+    save_lines_to_files(parsed_result, str(tmp_path))
+    assert load_line_from_file("200", str(tmp_path)).text == "Setup"
+
+    (tmp_path / "200.json").write_text(
+        json.dumps({"section": "200", "text": "Game Setup", "children": []})
+    )
+    assert load_line_from_file("200", str(tmp_path)).text == "Setup"
+
+    clear_section_cache()
+    assert load_line_from_file("200", str(tmp_path)).text == "Game Setup"
+
+
+def test_build_tree_outside_module(tmp_path):
+    """Test that a tree built by appending to children saves and loads back."""
+    root = Line(section="100", text="Game Concepts")
+    child = Line(section="101", text="Deck Construction")
+    root.children.append(child)
+    child.children.append(Line(section="101.1", text="Champion Legend"))
+    assert Line(section="200", text="Setup").children == []
+
+    save_lines_to_files([root], str(tmp_path))
+    loaded = load_line_from_file("100", str(tmp_path))
+    loaded.children.append(Line(section="102", text="Battlefields"))
+
+    assert [c.section for c in loaded.children] == ["101", "102"]
+    assert loaded.children[0].children[0].text == "Champion Legend"
+
+
+@pytest.mark.parametrize(
+    "line_break", ["\n", "\r\n", "\r", "\x0c", "\x0b", "\x85", "\u2028", "\u2029"]
+)
+def test_parse_splits_on_every_line_break(line_break):
+    """Test that sections split on every line boundary str.splitlines() knows."""
+    text = line_break.join(
+        ["100. Game Concepts", "101. Deck Construction", "101.1. Champion Legend"]
+    )
+    lines = parse_lines_to_objects(text)
+
+    assert [(line.section, line.text) for line in lines] == [("100", "Game Concepts")]
+    assert [(c.section, c.text) for c in lines[0].children] == [
+        ("101", "Deck Construction")
+    ]
+    assert lines[0].children[0].children[0].text == "Champion Legend"
@@ -0,0 +1,126 @@
+import io
+
+import pytest
+import requests
+
+import parse_errata
+from parse_errata import CardNameIndex, find_partial_matches, scan_card_names
+
+
+@pytest.fixture(params=["automaton", "index"])
+def matcher(request, monkeypatch):
+    """Fixture running find_partial_matches with and without pyahocorasick."""
+    if request.param == "automaton":
+        if parse_errata.ahocorasick is None:
+            pytest.skip("pyahocorasick is not installed")
+    else:
+        monkeypatch.setattr(parse_errata, "ahocorasick", None)
+    return find_partial_matches
+
+
+def test_card_name_contained_in_errata_name(matcher):
+    """Test that a card whose name is inside the errata name is a partial match."""
+    matches = matcher(["ahri"], ["ahri, alluring"])
+    assert matches == {"ahri, alluring": ("ahri", "partial")}
+
+
+def test_errata_name_contained_in_card_name(matcher):
+    """Test that a card whose name contains the errata name is a partial match."""
+    matches = matcher(["ahri, alluring"], ["alluring"])
+    assert matches == {"alluring": ("ahri, alluring", "partial")}
+
+
+def test_first_part_match(matcher):
+    """Test that the part before a comma matches when nothing else does."""
+    matches = matcher(["jinx, loose cannon"], ["jinx, rebel"])
+    assert matches == {"jinx, rebel": ("jinx, loose cannon", "first part")}
+
+
+def test_earlier_first_part_match_beats_later_partial_match(matcher):
+    """Test that the earliest matching card wins, whichever way it matches."""
+    matches = matcher(["jinx, loose cannon", "jinx, rebel spirit"], ["jinx, rebel"])
+    assert matches == {"jinx, rebel": ("jinx, loose cannon", "first part")}
+
+
+def test_containing_first_part_beats_later_equal_first_part(matcher):
+    """Test that an earlier card containing the first part beats a later equal one."""
+    matches = matcher(["blue jinx", "jinx, loose cannon"], ["jinx, rebel"])
+    assert matches == {"jinx, rebel": ("blue jinx", "first part")}
+
+
+def test_card_matching_both_ways_is_partial(matcher):
+    """Test that a card matching as partial and first part reports partial."""
+    matches = matcher(["jinx, rebel spirit"], ["jinx, rebel"])
+    assert matches == {"jinx, rebel": ("jinx, rebel spirit", "partial")}
+
+
+def test_exact_and_unmatched_names_are_skipped(matcher):
+    """Test that exact card names and names with no match are left out."""
+    matches = matcher(["ahri, alluring", "garen"], ["ahri, alluring", "teemo"])
+    assert matches == {}
+
+
+def test_short_first_part_match(matcher):
+    """Test that a first part shorter than an n-gram still matches in card order."""
+    matches = matcher(["viktor", "vi, piltover enforcer"], ["vi, rebel"])
+    assert matches == {"vi, rebel": ("viktor", "first part")}
+
+
+def test_empty_first_part_matches_first_card(matcher):
+    """Test that an empty first part matches the first card, like the scan."""
+    matches = matcher(["garen", "teemo"], [", rebel"])
+    assert matches == {", rebel": ("garen", "first part")}
+
+
+@pytest.mark.parametrize(
+    "card_name",
+    ["ahri, rebel", "blue jinx, spark", "jinx", "sett, the boss", "kai'sa", "zed"],
+)
+def test_card_name_index_agrees_with_scan(card_name):
+    """Test that CardNameIndex.find returns what the in-order scan returns."""
+    card_names = [
+        "blue jinx",
+        "jinx, loose cannon",
+        "ahri, alluring",
+        "sett",
+        "kai'sa, survivor",
+        "jinx, rebel spark",
+    ]
+    index = CardNameIndex(card_names)
+    assert index.find(card_name) == scan_card_names(card_name, card_names)
+
+
+class BrokenStream(io.BytesIO):
+    """Stream that fails partway through, like a dropped connection."""
+
+    def read(self, size=-1):
+        if self.tell():
+            raise requests.ConnectionError("connection reset")
+        return super().read(4)
+
+
+PDF_URL = "https://example.com/errata.pdf"
+
+
+def test_download_pdf_writes_file(fake_web, tmp_path):
+    """Test that a completed download ends up at the output path."""
+    fake_web.serve(PDF_URL, raw=io.BytesIO(b"%PDF-1.7 new"))
+    output_path = tmp_path / "errata.pdf"
+
+    parse_errata.download_pdf(PDF_URL, output_path)
+
+    assert output_path.read_bytes() == b"%PDF-1.7 new"
+    assert [p.name for p in tmp_path.iterdir()] == ["errata.pdf"]
+
+
+def test_failed_download_keeps_previous_pdf(fake_web, tmp_path):
+    """Test that a download cut off mid-stream leaves no truncated PDF behind."""
+    fake_web.serve(PDF_URL, raw=BrokenStream(b"%PDF-1.7 new"))
+    output_path = tmp_path / "errata.pdf"
+    output_path.write_bytes(b"%PDF-1.7 old")
+
+    with pytest.raises(requests.ConnectionError):
+        parse_errata.download_pdf(PDF_URL, output_path)
+
+    assert output_path.read_bytes() == b"%PDF-1.7 old"
+    assert [p.name for p in tmp_path.iterdir()] == ["errata.pdf"]
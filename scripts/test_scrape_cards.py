@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+import scrape_cards
+from scrape_cards import NEXT_DATA_PATTERN, fetch_next_data, find_gallery_cards
+
+NEXT_DATA = {
+    "props": {
+        "pageProps": {
+            "page": {
+                "blades": [
+                    {"type": "hero"},
+                    {
+                        "type": "riftboundCardGallery",
+                        "cards": {
+                            "items": [{"id": "ogn-001", "name": "Blazing Scorcher"}]
+                        },
+                    },
+                ]
+            }
+        }
+    }
+}
+
+
+@pytest.fixture
+def gallery_html():
+    """Fixture providing a small gallery page with a __NEXT_DATA__ script."""
+    return (
+        "<html><head>"
+        '<script src="/_next/app.js"></script>'
+        '<script id="__NEXT_DATA__" type="application/json">\n'
+        f"{json.dumps(NEXT_DATA)}\n"
+        "</script>"
+        "</head><body><div id='__next'></div></body></html>"
+    )
+
+
+def test_next_data_pattern_extracts_script_body(gallery_html):
+    """Test that only the __NEXT_DATA__ script body is captured."""
+    match = NEXT_DATA_PATTERN.search(gallery_html)
+    assert json.loads(match.group(1)) == NEXT_DATA
+
+
+def test_next_data_pattern_no_match():
+    """Test that a page without __NEXT_DATA__ does not match."""
+    assert NEXT_DATA_PATTERN.search("<html><script>var x = 1;</script></html>") is None
+
+
+def test_fetch_next_data(fake_web, gallery_html):
+    """Test that the gallery is fetched with a browser User-Agent and parsed."""
+    fake_web.serve("https://example.com/gallery/", gallery_html)
+    next_data = fetch_next_data("https://example.com/gallery/")
+
+    assert json.loads(next_data) == NEXT_DATA
+    assert fake_web.requests == [
+        ("https://example.com/gallery/", {"User-Agent": scrape_cards.USER_AGENT})
+    ]
+
+
+def test_fetch_next_data_missing(fake_web):
+    """Test that a page without __NEXT_DATA__ returns None."""
+    fake_web.serve(scrape_cards.GALLERY_URL, "<html></html>")
+    assert fetch_next_data() is None
+
+
+def test_find_gallery_cards(fake_web, gallery_html):
+    """Test that the card list is read from the riftboundCardGallery blade."""
+    fake_web.serve(scrape_cards.GALLERY_URL, gallery_html)
+    cards = find_gallery_cards(fetch_next_data())
+    assert cards == [{"id": "ogn-001", "name": "Blazing Scorcher"}]
+
+
+def test_find_gallery_cards_without_blade():
+    """Test that a page without the gallery blade returns None."""
+    assert find_gallery_cards(json.dumps({"props": {}})) is None
@@ -1,5 +1,19 @@
+import os
+
 import pytest
-from tr_parse import parse_lines_to_objects
+
+import tr_parse
+from tr_parse import (
+    ARCHIVE_FILENAME,
+    Line,
+    line_to_dict,
+    load_all_lines,
+    load_line_from_file,
+    get_webpage_text,
+    html_to_text,
+    parse_lines_to_objects,
+    save_lines_to_files,
+)
 
 
 @pytest.fixture
@@ -77,3 +91,200 @@ def test_leaf_sections_have_no_children(parsed_result):
     """Test that leaf sections have no children."""
     section_200 = next(line for line in parsed_result if line.section == "200")
     assert len(section_200.children) == 0
+
+
+@pytest.mark.parametrize(
+    "line_break", ["\n", "\r\n", "\r", "\x0c", "\x0b", "\x85", "\u2028", "\u2029"]
+)
+def test_parse_splits_on_every_line_break(line_break):
+    """Test that sections split on every line boundary str.splitlines() knows."""
+    text = line_break.join(["100. Introduction", "101. Purpose", "101.1. Scope"])
+    lines = parse_lines_to_objects(text)
+
+    assert [(line.section, line.text) for line in lines] == [("100", "Introduction")]
+    assert [(c.section, c.text) for c in lines[0].children] == [("101", "Purpose")]
+    assert lines[0].children[0].children[0].text == "Scope"
+
+
+def test_build_tree_outside_module(tmp_path):
+    """Test that a tree built by appending to children saves and loads back."""
+    root = Line(section="100", text="Introduction")
+    child = Line(section="101", text="Purpose")
+    root.children.append(child)
+    child.children.append(Line(section="101.1", text="Scope"))
+    assert Line(section="200", text="Definitions").children == []
+
+    save_lines_to_files([root], str(tmp_path))
+    loaded = load_line_from_file("100", str(tmp_path))
+    loaded.children.append(Line(section="102", text="Consistency"))
+
+    assert [c.section for c in loaded.children] == ["101", "102"]
+    assert loaded.children[0].children[0].text == "Scope"
+
+
+@pytest.mark.parametrize(
+    "page_text,expected",
+    [
+        # Cross-references stay on their line ("See" is written back lowercase)
+        (
+            "103.2. Spectators: See 204.8. for more.",
+            "103.2. Spectators: see 204.8. for more.",
+        ),
+        ("See\xa0602.3. applies", "see 602.3. applies"),
+        ("See 602.3.d.603.1. Next", "see 602.3.d.603.1. Next"),
+        (
+            "Players follow CR 127. Privacy applies.",
+            "Players follow CR 127. Privacy applies.",
+        ),
+        ("as described in section 700. Later", "as described in section 700. Later"),
+        # Only "See <number>" is a reference; "See rule <number>" is split
+        ("See rule 602.3.d. for details.", "See rule \n602.3.d. for details."),
+        # A section glued onto a reference is still split off
+        ("Players follow CR 127.603.1. Next", "Players follow CR 127.\n603.1. Next"),
+        ("in section 700.800. Definitions", "in section 700.\n800. Definitions"),
+        # Section numbers glued onto the previous text
+        ("Some text.603.1. Next rule", "Some text.\n603.1. Next rule"),
+        ("Some text 603.1. Next rule", "Some text \n603.1. Next rule"),
+        ("Introduction100. Next", "Introduction\n100. Next"),
+        ("text603.1.a. Lettered", "text\n603.1.a. Lettered"),
+        ("end 603.1.  two spaces", "end \n603.1. two spaces"),
+        ("Intro.\xa0603.1.\xa0Next", "Intro.\xa0\n603.1. Next"),
+        ("2v2603.1. Team play", "2v2\n603.1. Team play"),
+        ("602.4.b.5.603. Deck Rules", "602.4.b.5.\n603. Deck Rules"),
+        # Not split
+        ("(see 602.3.) and more", "(see 602.3.) and more"),
+        ("Version 1.2. release notes", "Version 1.2. release notes"),
+        ("12345. Not a section", "12345. Not a section"),
+        ("Rule 100.Introduction", "Rule 100.Introduction"),
+        ("Glued603.1.Next", "Glued603.1.Next"),
+        # Lowercase lines are joined onto the previous line
+        ("Upper\nlower continues", "Upper lower continues"),
+    ],
+)
+@pytest.mark.parametrize("html_parser", tr_parse.HTML_PARSERS)
+def test_html_to_text_splits_sections(page_text, expected, html_parser):
+    """Test where html_to_text starts new section lines, pinned to the original output."""
+    if html_parser == "lxml" and tr_parse.HTML_PARSER != "lxml":
+        pytest.skip("lxml is not installed")
+    assert html_to_text(f"<p>{page_text}</p>", html_parser) == expected
+
+
+def test_archive_round_trip(parsed_result, tmp_path):
+    """Test that sections saved to the archive load back unchanged."""
+    save_lines_to_files(parsed_result, str(tmp_path), archive=True)
+    (tmp_path / "100.json").unlink()
+    (tmp_path / "200.json").unlink()
+
+    loaded = load_all_lines(str(tmp_path))
+    assert [line_to_dict(line) for line in loaded] == [
+        line_to_dict(line) for line in parsed_result
+    ]
+
+
+def test_archive_save_keeps_section_files(parsed_result, tmp_path):
+    """Test that an archive save still writes the files the site imports."""
+    (tmp_path / "metadata.json").write_text("{}")
+    save_lines_to_files(parsed_result, str(tmp_path), archive=True)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "100.json",
+        "200.json",
+        "metadata.json",
+        ARCHIVE_FILENAME,
+    ]
+
+    section_100 = load_line_from_file("100", str(tmp_path))
+    assert line_to_dict(section_100) == line_to_dict(parsed_result[0])
+
+
+def test_load_section_from_archive(parsed_result, tmp_path):
+    """Test that a single section loads from the archive when its file is missing."""
+    save_lines_to_files(parsed_result, str(tmp_path), archive=True)
+    (tmp_path / "200.json").unlink()
+
+    section_200 = next(line for line in parsed_result if line.section == "200")
+    loaded = load_line_from_file("200", str(tmp_path))
+    assert line_to_dict(loaded) == line_to_dict(section_200)
+
+    with pytest.raises(FileNotFoundError):
+        load_line_from_file("300", str(tmp_path))
+
+
+def test_section_save_removes_archive(parsed_result, tmp_path):
+    """Test that saving per-section files removes an archive from an earlier save."""
+    save_lines_to_files(parsed_result, str(tmp_path), archive=True)
+    save_lines_to_files(parsed_result, str(tmp_path))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["100.json", "200.json"]
+
+    loaded = load_all_lines(str(tmp_path))
+    assert [line_to_dict(line) for line in loaded] == [
+        line_to_dict(line) for line in parsed_result
+    ]
+
+
+PAGE_URL = "https://example.com/rules/"
+PAGE_HTML = (
+    "<html><body><p>100. Introduction</p><p>101. Purpose: Rules.</p></body></html>"
+)
+
+
+@pytest.fixture
+def fake_session(fake_web, monkeypatch, tmp_path):
+    """Fixture serving the rules page with an ETag and caching into tmp_path."""
+    fake_web.serve(PAGE_URL, PAGE_HTML, etag='"v1"')
+    monkeypatch.setattr(tr_parse, "CACHE_DIR", str(tmp_path))
+    return fake_web
+
+
+def test_cache_is_off_by_default(fake_session, tmp_path):
+    """Test that a plain fetch sends no validators and writes no cache file."""
+    assert get_webpage_text(PAGE_URL) == html_to_text(PAGE_HTML)
+    assert fake_session.requests == [(PAGE_URL, {})]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_200_then_304(fake_session):
+    """Test that a cached page is revalidated and reused on 304 Not Modified."""
+    first = get_webpage_text(PAGE_URL, use_cache=True)
+    second = get_webpage_text(PAGE_URL, use_cache=True)
+
+    assert first == second == html_to_text(PAGE_HTML)
+    assert fake_session.requests == [
+        (PAGE_URL, {}),
+        (PAGE_URL, {"If-None-Match": '"v1"'}),
+    ]
+
+
+def test_cache_304_reparses_html(fake_session, monkeypatch):
+    """Test that the cached HTML goes through the current parser on a 304."""
+    get_webpage_text(PAGE_URL, use_cache=True)
+    monkeypatch.setattr(
+        tr_parse, "html_to_text", lambda html, html_parser=None: "reparsed"
+    )
+
+    assert get_webpage_text(PAGE_URL, use_cache=True) == "reparsed"
+    assert fake_session.requests[-1] == (PAGE_URL, {"If-None-Match": '"v1"'})
+
+
+def test_changed_page_replaces_cache(fake_session):
+    """Test that a 200 for a new ETag is returned and cached."""
+    get_webpage_text(PAGE_URL, use_cache=True)
+    fake_session.serve(PAGE_URL, PAGE_HTML, etag='"v2"')
+
+    assert get_webpage_text(PAGE_URL, use_cache=True) == html_to_text(PAGE_HTML)
+    get_webpage_text(PAGE_URL, use_cache=True)
+    assert fake_session.requests[-1] == (PAGE_URL, {"If-None-Match": '"v2"'})
+
+
+@pytest.mark.parametrize(
+    "contents", ['{"etag": "\\"v1\\"", "ht', '{"etag": "\\"v1\\""}']
+)
+def test_unusable_cache_falls_back_to_full_get(fake_session, contents):
+    """Test that a truncated or incomplete cache entry is ignored and rewritten."""
+    cache_path = tr_parse._cache_path(PAGE_URL)
+    with open(cache_path, "w", encoding="utf-8") as f:
+        f.write(contents)
+
+    assert get_webpage_text(PAGE_URL, use_cache=True) == html_to_text(PAGE_HTML)
+    assert fake_session.requests == [(PAGE_URL, {})]
+    assert os.listdir(os.path.dirname(cache_path)) == [os.path.basename(cache_path)]
+    assert tr_parse._read_cache(cache_path)["html"] == PAGE_HTML
@@ -1,12 +1,26 @@
-import json
+import hashlib
+import importlib.util
 import os
 import re
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import List
 
 import requests
 from bs4 import BeautifulSoup
 
+from jsonio import read_json, write_json
+
+# BeautifulSoup parsers html_to_text accepts. The two tokenize malformed
+# markup differently, so parse_and_save prints the one used and the command
+# line can pin it with --html-parser
+HTML_PARSERS = ("lxml", "html.parser")
+
+# Prefer the C-based lxml parser when it is installed; fall back to the stdlib one
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Directory containing this script; relative input/output dirs resolve against it
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Original tournament rules URL
 ORIGINAL_URL = "https://riftbound.leagueoflegends.com/en-us/news/organizedplay/riftbound-tournament-rules/"
 
@@ -16,21 +30,201 @@ JANUARY_UPDATE_URL = "https://riftbound.leagueoflegends.com/en-us/news/announcem
 # Default URL for backwards compatibility
 url = ORIGINAL_URL
 
+# Shared HTTP session, so repeated fetches from the rules site reuse one
+# pooled keep-alive connection (requests already asks for gzip/deflate)
+_session = requests.Session()
+
+# Opt-in per-URL cache of the raw page HTML and its ETag/Last-Modified
+# validators, so an unchanged page costs one conditional GET instead of a
+# download. The HTML is always re-parsed, so parser changes take effect.
+CACHE_DIR = os.path.join(SCRIPT_DIR, ".cache")
+
+
+# Section number as written in the rules: 3 digits, then zero or more (.digit or .letter)
+# groups, e.g. 601, 601.1, 601.1.a, 601.1.a.1
+_SECTION = r"\d{3}(?:\.\d+)*(?:\.[a-z])?(?:\.\d+)*"
+
+# The split passes scan the whole page, so they are compiled with re.ASCII:
+# the en-us rules only number sections with ASCII digits, and \d/\D checks are
+# cheaper without Unicode lookups. Whitespace stays Unicode-aware, since the
+# page text contains non-breaking spaces.
+_WHITESPACE = r"(?u:\s+)"
+
+# First split pass. References like "CR 127. Privacy", "section 700." and
+# "See 602.3.d." are matched first so they are never split; a section number
+# glued directly onto the end of a reference is still split off.
+# Otherwise split on subsection numbers preceded by a non-digit.
+_SPLIT_AFTER_TEXT = re.compile(
+    rf"""
+    (?:
+        CR{_WHITESPACE}(?P<cr>\d{{3}})            # "CR 127."
+      | section{_WHITESPACE}(?P<ref>\d{{3}})      # "section 700."
+      | [Ss]ee{_WHITESPACE}(?P<see>{_SECTION})    # "See 602.3.d."
+    )\.
+    (?:(?P<after>{_SECTION})\.{_WHITESPACE})?     # section glued onto the reference
+    | (?P<prefix>\D)(?P<section>{_SECTION})\.{_WHITESPACE}  # section after a non-digit
+    """,
+    re.ASCII | re.VERBOSE,
+)
+
+# Second pass: split concatenated sections like "2v2603.1." where a single digit precedes a 3-digit section
+# Only match if it's clearly a new section (3 digits starting with pattern like X00 or has dots)
+# "see" references were normalized by the first pass and are skipped again here.
+_SPLIT_AFTER_DIGIT = re.compile(
+    rf"""
+    see[ ]{_SECTION}\.                            # "see 602.3." reference, kept
+    | (?P<prefix>\d)                              # digit ending the previous text
+      (?P<section>\d{{3}}\.\d+(?:\.[a-z])?(?:\.\d+)*)\.{_WHITESPACE}
+    """,
+    re.ASCII | re.VERBOSE,
+)
+
+# Third pass: handle top-level sections after patterns like ".5.603." (subsection ending, new section starting)
+# The source sometimes has "602.4.b.5.603." where 603 should be a new section
+# Match: .digit. followed by 3-digit section number (the extra dot before the section)
+_SPLIT_AFTER_SUBSECTION = re.compile(
+    rf"""
+    see[ ]{_SECTION}\.                            # "see 602.3." reference, kept
+    | (?P<prefix>\.\d)\.(?P<section>\d{{3}})\.{_WHITESPACE}  # ".5.603. "
+    """,
+    re.ASCII | re.VERBOSE,
+)
+
+
+def _split_after_text(match):
+    """Replacement for _SPLIT_AFTER_TEXT: keep references, split before sections."""
+    section = match.group("section")
+    if section is not None:
+        return f"{match.group('prefix')}\n{section}. "
+
+    # References are written back with single spaces and a lowercase "see"
+    if match.group("cr") is not None:
+        reference = f"CR {match.group('cr')}."
+    elif match.group("ref") is not None:
+        reference = f"section {match.group('ref')}."
+    else:
+        reference = f"see {match.group('see')}."
+
+    after = match.group("after")
+    if after is None:
+        return reference
+    return f"{reference}\n{after}. "
+
+
+def _split_section(match):
+    """Replacement for the later split passes: pass references through untouched."""
+    section = match.group("section")
+    if section is None:
+        return match.group(0)
+    return f"{match.group('prefix')}\n{section}. "
+
+
+# A line after the first whose first non-blank character could be lowercase.
+# Lines starting with a digit or an uppercase ASCII letter (section numbers,
+# headings) never reach the replacement callback.
+_CONTINUATION_LINE = re.compile(r"\n[^\S\n]*([^\sA-Z0-9][^\n]*)")
+
+
+def _join_continuation(match):
+    """Replacement for _CONTINUATION_LINE: append lowercase lines to the previous line."""
+    line = match.group(1)
+    if not line[0].islower():
+        return match.group(0)
+    return " " + line.rstrip()
 
-def get_webpage_text(url):
+
+def _cache_path(url):
+    """Return the cache file path for a URL."""
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"tr_rules_{digest}.json")
+
+
+def _read_cache(cache_path):
+    """Return the cached entry at cache_path, or None if it is missing or unusable."""
+    try:
+        cached = read_json(cache_path)
+    except (OSError, ValueError):
+        return None  # Missing, unreadable, or truncated/corrupt JSON
+    if not isinstance(cached, dict) or not isinstance(cached.get("html"), str):
+        return None
+    return cached
+
+
+def _write_cache(cache_path, entry):
+    """Write a cache entry atomically, so readers never see a partial file."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        write_json(tmp_path, entry)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        # The cache is only an optimization; never fail a run over it
+        print(f"Warning: could not write cache file {cache_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def get_webpage_text(url, use_cache=False, html_parser=None):
     """
     Fetches a webpage and parses it to text.
 
+    With use_cache, the page's HTML is cached in CACHE_DIR together with the
+    response's ETag/Last-Modified. Later calls send a conditional GET and reuse
+    the cached HTML when the server answers 304 Not Modified. The HTML is
+    parsed on every call either way.
+
     Args:
         url (str): The URL of the webpage to fetch
+        use_cache (bool): Read and update the conditional-GET cache
+        html_parser (str): BeautifulSoup parser, HTML_PARSER when None
 
     Returns:
         str: The text content of the webpage
     """
-    response = requests.get(url)
+    cache_path = _cache_path(url)
+    cached = _read_cache(cache_path) if use_cache else None
+    headers = {}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = _session.get(url, headers=headers, timeout=30)
+    if cached is not None and response.status_code == 304:
+        return html_to_text(cached["html"], html_parser)
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    html = response.text
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if use_cache and (etag or last_modified):
+        _write_cache(
+            cache_path,
+            {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "html": html,
+            },
+        )
+
+    return html_to_text(html, html_parser)
+
+
+def html_to_text(html, html_parser=None):
+    """
+    Converts a rules page's HTML to text with one section per line.
+
+    Args:
+        html (str): The HTML of the rules page
+        html_parser (str): BeautifulSoup parser, HTML_PARSER when None
+
+    Returns:
+        str: The cleaned text content
+    """
+    soup = BeautifulSoup(html, html_parser or HTML_PARSER)
 
     # Remove script and style elements
     for script in soup(["script", "style"]):
@@ -39,71 +233,48 @@ def get_webpage_text(url):
     # Get text and clean it up
     text = soup.get_text()
 
-    # Break into lines and remove leading/trailing space
-    lines = (line.strip() for line in text.splitlines())
-
-    # Break multi-headlines into a line each
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-
-    # Remove blank lines
-    text = "\n".join(chunk for chunk in chunks if chunk)
+    # Break multi-headlines into a line each, strip each phrase and drop blanks.
+    # Stripping the whole line first is redundant: its edges only ever end up
+    # in whitespace-only phrases, which are dropped anyway
+    text = "\n".join(
+        chunk
+        for line in text.splitlines()
+        for phrase in line.split("  ")
+        if (chunk := phrase.strip())
+    )
 
     # Split on section numbers that might be concatenated (e.g., "text100. Introduction")
     # Need to handle both top-level (100.) and subsections (601.1., 601.1.a., 601.1.a.1.)
     # BUT: Don't split if preceded by "CR ", "section ", or "See " (references)
-
-    # First, protect references by temporarily replacing them
-    # CR references like "CR 127. Privacy"
-    text = re.sub(r"CR\s+(\d{3})\.", r"CR_REF_\1_DOT", text)
-    # "section 700." references
-    text = re.sub(r"section\s+(\d{3})\.", r"section_REF_\1_DOT", text)
-    # "See 602.3.d." or "see 602.3.d." references (with optional subsections)
-    text = re.sub(
-        r"[Ss]ee\s+(\d{3}(?:\.\d+)*(?:\.[a-z])?(?:\.\d+)*)\.",
-        r"see_REF_\1_DOT",
-        text,
-    )
-
-    # Split on subsection numbers like 601.1. or 601.1.a. or 601.1.a.1.
-    # Pattern: 3 digits, then zero or more (.digit or .letter) groups, then ". " and content
-    # Use word boundary or non-digit to avoid splitting mid-number, but allow after short numbers like "2v2"
-    # First pass: split where preceded by non-digit
-    text = re.sub(
-        r"(\D)(\d{3}(?:\.\d+)*(?:\.[a-z])?(?:\.\d+)*)\.\s+", r"\1\n\2. ", text
-    )
-    # Second pass: split concatenated sections like "2v2603.1." where a single digit precedes a 3-digit section
-    # Only match if it's clearly a new section (3 digits starting with pattern like X00 or has dots)
-    text = re.sub(r"(\d)(\d{3}\.\d+(?:\.[a-z])?(?:\.\d+)*)\.\s+", r"\1\n\2. ", text)
-    # Third pass: handle top-level sections after patterns like ".5.603." (subsection ending, new section starting)
-    # The source sometimes has "602.4.b.5.603." where 603 should be a new section
-    # Match: .digit. followed by 3-digit section number (the extra dot before the section)
-    text = re.sub(r"(\.\d)\.(\d{3})\.\s+", r"\1\n\2. ", text)
-
-    # Restore protected references
-    text = re.sub(r"CR_REF_(\d{3})_DOT", r"CR \1.", text)
-    text = re.sub(r"section_REF_(\d{3})_DOT", r"section \1.", text)
-    text = re.sub(
-        r"see_REF_(\d{3}(?:\.\d+)*(?:\.[a-z])?(?:\.\d+)*)_DOT",
-        r"see \1.",
-        text,
-    )
+    text = _SPLIT_AFTER_TEXT.sub(_split_after_text, text)
+    text = _SPLIT_AFTER_DIGIT.sub(_split_section, text)
+    text = _SPLIT_AFTER_SUBSECTION.sub(_split_section, text)
 
     # Join continuation lines (lines starting with lowercase) with previous line
-    lines = text.splitlines()
-    joined_lines = []
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped and i > 0 and stripped[0].islower():
-            # This is a continuation line, append to previous
-            if joined_lines:
-                joined_lines[-1] = joined_lines[-1] + " " + stripped
-        else:
-            joined_lines.append(line)
-    text = "\n".join(joined_lines)
+    text = _CONTINUATION_LINE.sub(_join_continuation, text)
 
     return text
 
 
+# Matches a "<rule number>. <content>" line with a three-digit rule number
+NUMBERED_LINE_PATTERN = re.compile(r"^(\d{3})\.\s*(.*)$")
+
+# Matches one "<section>. <content>" line anywhere in a text blob.
+# Section numbers are digits, letters, and combinations with periods
+# Examples: 100, 204, 204.1, 204.1.a, 204.1.a.1
+# Matches: number or letter, optionally followed by .number or .letter repeated
+# Surrounding horizontal whitespace is excluded so it matches a stripped line.
+SECTION_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*((?:\d+|[a-zA-Z])(?:\.(?:\d+|[a-zA-Z]))*)\.[^\S\n]+(\S(?:.*\S)?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Line boundaries that str.splitlines() recognizes besides "\n". Text from the
+# PDF extractors can contain "\r", form feeds or Unicode line separators, so
+# they become "\n" before SECTION_LINE_PATTERN scans the text line by line.
+LINE_BREAK_PATTERN = re.compile(r"\r\n?|[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+
 def parse_numbered_lines(text):
     """
     Parses text to find lines matching the pattern \d\d\d. (three digits followed by a period).
@@ -115,10 +286,13 @@ def parse_numbered_lines(text):
         dict: Dictionary with the rule number as key and the line content as value
     """
     numbered_lines = {}
-    pattern = re.compile(r"^(\d{3})\.\s*(.*)$")
 
     for line in text.splitlines():
-        match = pattern.match(line.strip())
+        stripped = line.strip()
+        # Cheap prefilter: numbered lines always start with a digit
+        if not stripped[:1].isdigit():
+            continue
+        match = NUMBERED_LINE_PATTERN.match(stripped)
         if match:
             rule_number = match.group(1)
             content = match.group(2)
@@ -127,7 +301,7 @@ def parse_numbered_lines(text):
     return numbered_lines
 
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     section: str
     text: str
@@ -148,97 +322,158 @@ def parse_lines_to_objects(text):
         list: List of top-level Line objects with nested children
     """
     top_level_lines = []
-    section_map = {}  # Maps section number to Line object
-
-    # Pattern matches: digits, letters, and combinations with periods
-    # Examples: 100, 204, 204.1, 204.1.a, 204.1.a.1
-    # Matches: number or letter, optionally followed by .number or .letter repeated
-    pattern = re.compile(r"^((?:\d+|[a-zA-Z])(?:\.(?:\d+|[a-zA-Z]))*)\.\s+(.*)$")
-
-    all_sections = []  # List of (section, content) tuples in order
+    section_map = {}  # Maps section number to Line object, in document order
 
     # First pass: Create all Line objects
     # Skip duplicates - only keep first occurrence of each section
-    for line in text.splitlines():
-        stripped = line.strip()
-        match = pattern.match(stripped)
-        if match:
-            section = match.group(1)
-            content = match.group(2)
-            # Only add if we haven't seen this section before
-            if section not in section_map:
-                line_obj = Line(section=section, text=content)
-                section_map[section] = line_obj
-                all_sections.append(section)
+    text = LINE_BREAK_PATTERN.sub("\n", text)
+    for match in SECTION_LINE_PATTERN.finditer(text):
+        section = match.group(1)
+        content = match.group(2)
+        # Only add if we haven't seen this section before
+        if section not in section_map:
+            line_obj = Line(section=section, text=content)
+            section_map[section] = line_obj
 
     # Second pass: Build hierarchy
-    for section in all_sections:
-        line_obj = section_map[section]
-        parts = section.split(".")
+    get_line = section_map.get
+    for section, line_obj in section_map.items():
+        dot = section.rfind(".")
 
-        if len(parts) == 1:
+        if dot < 0:
             # Single number like "000", "001", "100", "101", "200"
-            section_num = int(section)
-            if section_num % 100 == 0:
-                # Top-level section (000, 100, 200, 300, etc.)
-                top_level_lines.append(line_obj)
+            if len(section) == 3 and section.isascii():
+                # The usual three ASCII digits: compare strings, no int round trip
+                is_top_level = section.endswith("00")
+                parent_section = section[0] + "00"
             else:
-                # Subsection of the nearest hundred (e.g., 001 is child of 000, 101 is child of 100)
-                parent_num = (section_num // 100) * 100
+                section_num = int(section)
+                is_top_level = section_num % 100 == 0
                 # Preserve leading zeros (e.g., 0 -> "000", 100 -> "100")
-                parent_section = f"{parent_num:03d}"
-                if parent_section in section_map:
-                    section_map[parent_section].children.append(line_obj)
-                else:
-                    # Parent not found, add to top level
-                    top_level_lines.append(line_obj)
+                parent_section = f"{section_num // 100 * 100:03d}"
+            if is_top_level:
+                # Top-level section (000, 100, 200, 300, etc.)
+                top_level_lines.append(line_obj)
+                continue
+            # Subsection of the nearest hundred (e.g., 001 is child of 000, 101 is child of 100)
+            parent = get_line(parent_section)
         else:
             # Has dots, so find parent by removing last component
-            parent_section = ".".join(parts[:-1])
-            if parent_section in section_map:
-                section_map[parent_section].children.append(line_obj)
-            else:
-                # Direct parent missing — walk up the ancestor chain
-                ancestor_parts = parts[:-2]
-                attached = False
-                while ancestor_parts:
-                    ancestor = ".".join(ancestor_parts)
-                    if ancestor in section_map:
-                        section_map[ancestor].children.append(line_obj)
-                        attached = True
-                        break
-                    ancestor_parts = ancestor_parts[:-1]
-                if not attached:
-                    top_level_lines.append(line_obj)
+            parent = get_line(section[:dot])
+            # Direct parent missing — walk up the ancestor chain
+            while parent is None:
+                dot = section.rfind(".", 0, dot)
+                if dot < 0:
+                    break
+                parent = get_line(section[:dot])
+
+        if parent is not None:
+            parent.children.append(line_obj)
+        else:
+            # Parent not found, add to top level
+            top_level_lines.append(line_obj)
 
     return top_level_lines
 
 
+# Single-file copy of all sections written by save_lines_to_files(...,
+# archive=True). The dotted name keeps it out of the per-section file scans
+# here and in the site's import_rules/sync_rules commands.
+ARCHIVE_FILENAME = "sections.archive.json"
+
+
+def line_to_dict(line: Line) -> dict:
+    """Convert a Line and all its children to a dict, iterating with a stack."""
+    root = {"section": line.section, "text": line.text, "children": []}
+    stack = [(line, root)]
+    while stack:
+        node, node_dict = stack.pop()
+        for child in node.children:
+            child_dict = {
+                "section": child.section,
+                "text": child.text,
+                "children": [],
+            }
+            node_dict["children"].append(child_dict)
+            stack.append((child, child_dict))
+    return root
+
+
+def dict_to_line(d: dict) -> Line:
+    """Convert dict to Line object, walking the tree with a stack."""
+    root = Line(section=d["section"], text=d["text"])
+    stack = [(d, root)]
+    while stack:
+        node_dict, node = stack.pop()
+        for child_dict in node_dict["children"]:
+            child = Line(section=child_dict["section"], text=child_dict["text"])
+            node.children.append(child)
+            stack.append((child_dict, child))
+    return root
+
+
+def _find_section_files(abs_dir: str) -> list:
+    """
+    Finds the per-section files ("100.json", "200.json", ...) in a directory.
+
+    Args:
+        abs_dir: Absolute directory path
+
+    Returns:
+        List of (section number, path) tuples, sorted by section number
+    """
+    # Collect (section number, path) for each top-level section file. DirEntry
+    # caches the file type and full path, so no extra stat or join is needed
+    top_level_sections = []
+    with os.scandir(abs_dir) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.endswith(".json"):
+                continue
+            section = entry.name[:-5]
+            # Skip metadata file
+            if section == "metadata":
+                continue
+            # Top-level sections have no dots (e.g., "100", "200")
+            if "." in section:
+                continue
+            try:
+                top_level_sections.append((int(section), entry.path))
+            except ValueError:
+                continue  # Not a section number, skip
+
+    # Sort numerically
+    top_level_sections.sort()
+    return top_level_sections
+
+
 def save_lines_to_files(
-    lines: List[Line], output_dir: str = "../rules_source/trsections"
+    lines: List[Line],
+    output_dir: str = "../rules_source/trsections",
+    archive: bool = False,
 ):
     """
     Saves each top-level Line object (with all its children) to a separate JSON file.
     Files are named by section number (e.g., "104.json").
 
+    With archive=True, all top-level sections are also written to a single
+    ARCHIVE_FILENAME keyed by section number, which load_all_lines reads in one
+    go. The per-section files are still written, since the site's
+    import_rules/sync_rules commands only read those. Saving without archive
+    removes an archive left by an earlier run, so it never shadows newer files.
+
     Args:
         lines: List of top-level Line objects to save
         output_dir: Directory path relative to script location
+        archive: Also write all sections to one archive file
     """
-    # Get absolute path relative to this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    abs_output_dir = os.path.join(script_dir, output_dir)
+    # Resolve relative paths against this script; absolute ones pass through
+    abs_output_dir = os.path.join(SCRIPT_DIR, output_dir)
 
     # Create directory if it doesn't exist
     os.makedirs(abs_output_dir, exist_ok=True)
 
-    def line_to_dict(line: Line) -> dict:
-        """Recursively convert a Line and all its children to a dict."""
-        return {
-            "section": line.section,
-            "text": line.text,
-            "children": [line_to_dict(child) for child in line.children],
-        }
+    archive_path = os.path.join(abs_output_dir, ARCHIVE_FILENAME)
+    sections = {}
 
     # Save each top-level line with all its children to one file
     # Only save true top-level sections (3-digit numbers ending in 00, like 000, 100, 200)
@@ -255,20 +490,29 @@ def save_lines_to_files(
 
         line_dict = line_to_dict(line)
 
+        if archive:
+            sections[line.section] = line_dict
+
         # Save to file named by top-level section number
         filename = f"{line.section}.json"
         filepath = os.path.join(abs_output_dir, filename)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(line_dict, f, indent=2, ensure_ascii=False)
+        write_json(filepath, line_dict)
+
+    if archive:
+        write_json(archive_path, sections)
+    elif os.path.exists(archive_path):
+        # load_all_lines prefers the archive, so drop one left by an earlier run
+        os.remove(archive_path)
 
 
 def load_line_from_file(
     section: str, input_dir: str = "../rules_source/trsections"
 ) -> Line:
     """
-    Loads a Line object from a JSON file.
-    Recursively loads children.
+    Loads a Line object from a JSON file, including all of its children.
+    Falls back to the section's entry in ARCHIVE_FILENAME when its own file
+    is missing.
 
     Args:
         section: Section number (e.g., "104", "104.1")
@@ -277,27 +521,28 @@ def load_line_from_file(
     Returns:
         Line object with all children loaded
     """
-    # Get absolute path relative to this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    abs_input_dir = os.path.join(script_dir, input_dir)
+    # Resolve relative paths against this script; absolute ones pass through
+    abs_input_dir = os.path.join(SCRIPT_DIR, input_dir)
 
     filename = f"{section}.json"
     filepath = os.path.join(abs_input_dir, filename)
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        line_dict = json.load(f)
-
-    def dict_to_line(d: dict) -> Line:
-        """Recursively convert dict to Line object."""
-        children = [dict_to_line(child) for child in d["children"]]
-        return Line(section=d["section"], text=d["text"], children=children)
-
-    return dict_to_line(line_dict)
+    try:
+        return dict_to_line(read_json(filepath))
+    except FileNotFoundError:
+        archive_path = os.path.join(abs_input_dir, ARCHIVE_FILENAME)
+        if not os.path.exists(archive_path):
+            raise
+        sections = read_json(archive_path)
+        if section not in sections:
+            raise
+        return dict_to_line(sections[section])
 
 
 def load_all_lines(input_dir: str = "../rules_source/trsections") -> List[Line]:
     """
     Loads all top-level Line objects from the directory.
+    Reads ARCHIVE_FILENAME when present, otherwise the per-section files.
 
     Args:
         input_dir: Directory path relative to script location
@@ -305,37 +550,23 @@ def load_all_lines(input_dir: str = "../rules_source/trsections") -> List[Line]:
     Returns:
         List of top-level Line objects with all children loaded
     """
-    # Get absolute path relative to this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    abs_input_dir = os.path.join(script_dir, input_dir)
+    # Resolve relative paths against this script; absolute ones pass through
+    abs_input_dir = os.path.join(SCRIPT_DIR, input_dir)
 
     # Find all JSON files
     if not os.path.exists(abs_input_dir):
         return []
 
-    json_files = [f for f in os.listdir(abs_input_dir) if f.endswith(".json")]
-
-    # Extract section numbers and identify top-level (no dots in section number)
-    top_level_sections = []
-    for filename in json_files:
-        section = filename.replace(".json", "")
-        # Skip metadata file
-        if section == "metadata":
-            continue
-        # Top-level sections have no dots (e.g., "100", "200") or only digits before first dot
-        if "." not in section:
-            top_level_sections.append(section)
-
-    # Sort numerically
-    top_level_sections.sort(key=lambda x: int(x))
+    # Single archive: one read for every section
+    archive_path = os.path.join(abs_input_dir, ARCHIVE_FILENAME)
+    if os.path.exists(archive_path):
+        sections = read_json(archive_path)
+        return [dict_to_line(sections[s]) for s in sorted(sections, key=int)]
 
     # Load each top-level section
-    lines = []
-    for section in top_level_sections:
-        line = load_line_from_file(section, input_dir)
-        lines.append(line)
-
-    return lines
+    return [
+        dict_to_line(read_json(path)) for _, path in _find_section_files(abs_input_dir)
+    ]
 
 
 def save_metadata(output_dir: str, url: str):
@@ -348,8 +579,7 @@ def save_metadata(output_dir: str, url: str):
     """
     from datetime import date
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    abs_output_dir = os.path.join(script_dir, output_dir)
+    abs_output_dir = os.path.join(SCRIPT_DIR, output_dir)
 
     metadata = {
         "last_updated": date.today().isoformat(),
@@ -357,13 +587,19 @@ def save_metadata(output_dir: str, url: str):
     }
 
     filepath = os.path.join(abs_output_dir, "metadata.json")
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    write_json(filepath, metadata)
 
     print(f"Saved metadata: last_updated={metadata['last_updated']}")
 
 
-def parse_and_save(url: str, output_dir: str, description: str = ""):
+def parse_and_save(
+    url: str,
+    output_dir: str,
+    description: str = "",
+    archive: bool = False,
+    use_cache: bool = False,
+    html_parser: str = None,
+):
     """
     Fetches, parses, and saves tournament rules from a URL.
 
@@ -371,16 +607,21 @@ def parse_and_save(url: str, output_dir: str, description: str = ""):
         url: The URL to fetch rules from
         output_dir: Directory path relative to script location to save JSON files
         description: Optional description for logging
+        archive: Save all sections to a single archive file
+        use_cache: Reuse the cached page HTML when the server reports it unchanged
+        html_parser: BeautifulSoup parser, HTML_PARSER when None
     """
+    html_parser = html_parser or HTML_PARSER
     print(f"Fetching rules from: {url}")
     if description:
         print(f"Description: {description}")
+    print(f"HTML parser: {html_parser}")
 
-    text = get_webpage_text(url)
+    text = get_webpage_text(url, use_cache=use_cache, html_parser=html_parser)
     lines = parse_lines_to_objects(text)
 
     print(f"Saving {len(lines)} top-level sections to {output_dir}...")
-    save_lines_to_files(lines, output_dir)
+    save_lines_to_files(lines, output_dir, archive=archive)
     save_metadata(output_dir, url)
     print("Saved successfully!")
 
@@ -413,6 +654,22 @@ if __name__ == "__main__":
         help="Custom output directory (relative to script location)",
     )
 
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help=f"Also save all sections to a single {ARCHIVE_FILENAME} next to the per-section files",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache the page HTML in scripts/.cache and skip the download when the server reports it unchanged",
+    )
+    parser.add_argument(
+        "--html-parser",
+        choices=HTML_PARSERS,
+        help="BeautifulSoup parser to use (default: lxml when installed, otherwise html.parser)",
+    )
+
     args = parser.parse_args()
 
     # Determine URL and output directory
@@ -430,7 +687,14 @@ if __name__ == "__main__":
         description = "Original Tournament Rules"
 
     # Parse and save
-    lines = parse_and_save(target_url, output_dir, description)
+    lines = parse_and_save(
+        target_url,
+        output_dir,
+        description,
+        args.archive,
+        use_cache=args.cache,
+        html_parser=args.html_parser,
+    )
 
     # Test loading back
     print("\nLoading back from files...")